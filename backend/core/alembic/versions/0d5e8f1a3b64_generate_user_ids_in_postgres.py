@@ -0,0 +1,30 @@
+"""generate user ids in postgres
+
+Revision ID: 0d5e8f1a3b64
+Revises: 9f2c6b4a1d83
+Create Date: 2026-10-16 09:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d5e8f1a3b64'
+down_revision: Union[str, None] = '9f2c6b4a1d83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PostgreSQL 13; older servers get it from pgcrypto
+    if op.get_bind().dialect.server_version_info < (13,):
+        op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    op.alter_column("users", "id", server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    # pgcrypto is left installed; other objects may depend on it
+    op.alter_column("users", "id", server_default=None)
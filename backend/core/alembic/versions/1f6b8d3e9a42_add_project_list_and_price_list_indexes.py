@@ -0,0 +1,33 @@
+"""add project list and price list indexes
+
+Revision ID: 1f6b8d3e9a42
+Revises: 7a4d2e8c5f13
+Create Date: 2026-10-16 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1f6b8d3e9a42'
+down_revision: Union[str, None] = '7a4d2e8c5f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_projects_owner_updated", "projects", ["owner_id", "updated_at"])
+    op.create_index(
+        "ix_price_products_active_amount",
+        "price_products",
+        ["amount"],
+        postgresql_where=sa.text("active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_price_products_active_amount", table_name="price_products")
+    op.drop_index("ix_projects_owner_updated", table_name="projects")
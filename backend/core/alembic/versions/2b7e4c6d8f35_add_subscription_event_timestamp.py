@@ -0,0 +1,27 @@
+"""add subscription event timestamp
+
+Revision ID: 2b7e4c6d8f35
+Revises: 8e3f5a9b2c17
+Create Date: 2026-10-16 09:25:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7e4c6d8f35'
+down_revision: Union[str, None] = '8e3f5a9b2c17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable: existing rows accept the next event for them, whatever its time
+    op.add_column("subscriptions", sa.Column("stripe_event_created_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("subscriptions", "stripe_event_created_at")
@@ -0,0 +1,275 @@
+"""initial schema
+
+Revision ID: 3c9e1f0a7b21
+Revises:
+Create Date: 2026-10-16 09:00:00.000000
+
+The schema as it stood before migrations were tracked. Databases created by
+the app's old startup create_all already have some of these tables, so only
+the missing ones are created.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1f0a7b21'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("email", sa.String(length=255), nullable=False),
+            sa.Column("username", sa.String(length=255), nullable=False),
+            sa.Column("hashed_password", sa.String(length=255), nullable=True),
+            sa.Column("full_name", sa.String(length=255), nullable=True),
+            sa.Column("avatar_url", sa.String(length=500), nullable=True),
+            sa.Column("google_id", sa.String(length=255), nullable=True),
+            sa.Column("github_id", sa.String(length=255), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            sa.Column("is_verified", sa.Boolean(), nullable=True),
+            sa.Column("role", sa.Enum("USER", "ADMIN", name="userrole"), nullable=True),
+            sa.Column("subscription_plan", sa.Enum("FREE", "PRO", name="subscriptionplan"), nullable=True),
+            sa.Column("stripe_customer_id", sa.String(length=255), nullable=True),
+            sa.Column("stripe_subscription_id", sa.String(length=255), nullable=True),
+            sa.Column("tokens_used", sa.Integer(), nullable=True),
+            sa.Column("tokens_limit", sa.Integer(), nullable=True),
+            sa.Column("tokens_reset_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("last_login_at", sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("google_id"),
+            sa.UniqueConstraint("github_id"),
+            sa.UniqueConstraint("stripe_customer_id"),
+            sa.UniqueConstraint("stripe_subscription_id"),
+        )
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+        op.create_index("ix_users_username", "users", ["username"], unique=True)
+
+    if "sessions" not in existing:
+        op.create_table(
+            "sessions",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("refresh_token", sa.String(length=512), nullable=False),
+            sa.Column("access_token_jti", sa.String(length=255), nullable=True),
+            sa.Column("ip_address", sa.String(length=45), nullable=True),
+            sa.Column("user_agent", sa.String(length=512), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("last_activity", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_sessions_refresh_token", "sessions", ["refresh_token"], unique=True)
+
+    if "projects" not in existing:
+        op.create_table(
+            "projects",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("name", sa.String(length=255), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("owner_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("language", sa.String(length=50), nullable=True),
+            sa.Column("template", sa.String(length=50), nullable=True),
+            sa.Column("max_files", sa.Integer(), nullable=True),
+            sa.Column("total_size_kb", sa.Integer(), nullable=True),
+            sa.Column("max_size_kb", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("last_accessed_at", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["owner_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if "project_files" not in existing:
+        op.create_table(
+            "project_files",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("name", sa.String(length=255), nullable=False),
+            sa.Column("path", sa.String(length=1000), nullable=False),
+            sa.Column("type", sa.Enum("FILE", "DIRECTORY", name="filetype"), nullable=True),
+            sa.Column("content", sa.Text(), nullable=True),
+            sa.Column("language", sa.String(length=50), nullable=True),
+            sa.Column("encoding", sa.String(length=50), nullable=True),
+            sa.Column("size_bytes", sa.Integer(), nullable=True),
+            sa.Column("is_binary", sa.Boolean(), nullable=True),
+            sa.Column("mime_type", sa.String(length=100), nullable=True),
+            sa.Column("parent_id", postgresql.UUID(as_uuid=True), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["parent_id"], ["project_files.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if "chat_sessions" not in existing:
+        op.create_table(
+            "chat_sessions",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("title", sa.String(length=255), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if "chat_messages" not in existing:
+        op.create_table(
+            "chat_messages",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("session_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("role", sa.Enum("USER", "ASSISTANT", "SYSTEM", name="messagerole"), nullable=False),
+            sa.Column("content", sa.Text(), nullable=False),
+            sa.Column("file_references", sa.JSON(), nullable=True),
+            sa.Column("code_blocks", sa.JSON(), nullable=True),
+            sa.Column("token_count", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(["session_id"], ["chat_sessions.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if "code_generations" not in existing:
+        op.create_table(
+            "code_generations",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("message_id", postgresql.UUID(as_uuid=True), nullable=True),
+            sa.Column("prompt", sa.Text(), nullable=False),
+            sa.Column("generated_code", sa.Text(), nullable=False),
+            sa.Column("language", sa.String(length=50), nullable=False),
+            sa.Column("target_file_id", postgresql.UUID(as_uuid=True), nullable=True),
+            sa.Column("target_file_path", sa.String(length=1000), nullable=True),
+            sa.Column("model_used", sa.String(length=100), nullable=False),
+            sa.Column("temperature", sa.String(length=10), nullable=True),
+            sa.Column("tokens_used", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(["message_id"], ["chat_messages.id"], ondelete="SET NULL"),
+            sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["target_file_id"], ["project_files.id"], ondelete="SET NULL"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if "subscriptions" not in existing:
+        op.create_table(
+            "subscriptions",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("stripe_subscription_id", sa.String(length=255), nullable=False),
+            sa.Column("stripe_price_id", sa.String(length=255), nullable=False),
+            sa.Column("stripe_product_id", sa.String(length=255), nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum(
+                    "ACTIVE", "PAST_DUE", "CANCELED", "UNPAID", "TRIALING", "INCOMPLETE", "INCOMPLETE_EXPIRED",
+                    name="subscriptionstatus",
+                ),
+                nullable=False,
+            ),
+            sa.Column("current_period_start", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("current_period_end", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("cancel_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("canceled_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("trial_end", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("stripe_subscription_id"),
+            sa.UniqueConstraint("user_id"),
+        )
+
+    if "payments" not in existing:
+        op.create_table(
+            "payments",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("subscription_id", postgresql.UUID(as_uuid=True), nullable=True),
+            sa.Column("stripe_payment_intent_id", sa.String(length=255), nullable=False),
+            sa.Column("stripe_invoice_id", sa.String(length=255), nullable=True),
+            sa.Column("amount", sa.Integer(), nullable=False),
+            sa.Column("currency", sa.String(length=3), nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum("PENDING", "PROCESSING", "SUCCEEDED", "FAILED", "CANCELED", "REFUNDED", name="paymentstatus"),
+                nullable=False,
+            ),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("invoice_pdf", sa.String(length=500), nullable=True),
+            sa.Column("receipt_url", sa.String(length=500), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("paid_at", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["subscription_id"], ["subscriptions.id"], ondelete="SET NULL"),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("stripe_invoice_id"),
+            sa.UniqueConstraint("stripe_payment_intent_id"),
+        )
+
+    if "price_products" not in existing:
+        op.create_table(
+            "price_products",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("stripe_price_id", sa.String(length=255), nullable=False),
+            sa.Column("stripe_product_id", sa.String(length=255), nullable=False),
+            sa.Column("name", sa.String(length=255), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("amount", sa.Integer(), nullable=False),
+            sa.Column("currency", sa.String(length=3), nullable=False),
+            sa.Column("interval", sa.String(length=10), nullable=False),
+            sa.Column("interval_count", sa.Integer(), nullable=False),
+            sa.Column("features", sa.JSON(), nullable=False),
+            sa.Column("metadata", sa.JSON(), nullable=True),
+            sa.Column("active", sa.Boolean(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("stripe_price_id"),
+        )
+
+    if "webhook_events" not in existing:
+        op.create_table(
+            "webhook_events",
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("stripe_event_id", sa.String(length=255), nullable=False),
+            sa.Column("event_type", sa.String(length=100), nullable=False),
+            sa.Column("data", sa.JSON(), nullable=False),
+            sa.Column("processed", sa.Boolean(), nullable=False),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("stripe_event_id"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("webhook_events")
+    op.drop_table("price_products")
+    op.drop_table("payments")
+    op.drop_table("subscriptions")
+    op.drop_table("code_generations")
+    op.drop_table("chat_messages")
+    op.drop_table("chat_sessions")
+    op.drop_table("project_files")
+    op.drop_table("projects")
+    op.drop_index("ix_sessions_refresh_token", table_name="sessions")
+    op.drop_table("sessions")
+    op.drop_index("ix_users_username", table_name="users")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
+    for enum_name in ("paymentstatus", "subscriptionstatus", "messagerole", "filetype", "subscriptionplan", "userrole"):
+        sa.Enum(name=enum_name).drop(op.get_bind(), checkfirst=True)
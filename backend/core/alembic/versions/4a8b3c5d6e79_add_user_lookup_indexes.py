@@ -0,0 +1,41 @@
+"""add user lookup indexes
+
+Revision ID: 4a8b3c5d6e79
+Revises: 6c1d9e2f7a58
+Create Date: 2026-10-16 09:35:00.000000
+
+ix_users_email_lower replaces the case-sensitive unique index on email. The
+upgrade fails if two existing users' emails differ only in case; merge or
+rename those accounts first.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a8b3c5d6e79'
+down_revision: Union[str, None] = '6c1d9e2f7a58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_users_email_lower", "users", [sa.text("lower(email)")], unique=True)
+    op.drop_index("ix_users_email", table_name="users")
+    op.create_index(
+        "ix_users_active_plan",
+        "users",
+        ["subscription_plan"],
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index("ix_users_tokens_reset_at", "users", ["tokens_reset_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_tokens_reset_at", table_name="users")
+    op.drop_index("ix_users_active_plan", table_name="users")
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.drop_index("ix_users_email_lower", table_name="users")
@@ -0,0 +1,28 @@
+"""add chat message and file tree indexes
+
+Revision ID: 5d2a7c1e4b86
+Revises: 1f6b8d3e9a42
+Create Date: 2026-10-16 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a7c1e4b86'
+down_revision: Union[str, None] = '1f6b8d3e9a42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_chat_messages_session_created", "chat_messages", ["session_id", "created_at"])
+    op.create_index("ix_project_files_project_parent", "project_files", ["project_id", "parent_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_files_project_parent", table_name="project_files")
+    op.drop_index("ix_chat_messages_session_created", table_name="chat_messages")
@@ -0,0 +1,51 @@
+"""server-side timestamp defaults
+
+Revision ID: 6c1d9e2f7a58
+Revises: 2b7e4c6d8f35
+Create Date: 2026-10-16 09:30:00.000000
+
+The models no longer send these timestamps on insert, so the database must
+fill them.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c1d9e2f7a58'
+down_revision: Union[str, None] = '2b7e4c6d8f35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, default)
+TIMESTAMP_DEFAULTS = (
+    ("chat_sessions", "created_at", "now()"),
+    ("chat_sessions", "updated_at", "now()"),
+    # clock_timestamp() keeps messages inserted in one transaction ordered
+    ("chat_messages", "created_at", "clock_timestamp()"),
+    ("code_generations", "created_at", "now()"),
+    ("projects", "created_at", "now()"),
+    ("projects", "updated_at", "now()"),
+    ("project_files", "created_at", "now()"),
+    ("project_files", "updated_at", "now()"),
+    ("sessions", "created_at", "now()"),
+    ("sessions", "last_activity", "now()"),
+    ("subscriptions", "created_at", "now()"),
+    ("subscriptions", "updated_at", "now()"),
+    ("payments", "created_at", "now()"),
+    ("price_products", "created_at", "now()"),
+    ("webhook_events", "created_at", "now()"),
+)
+
+
+def upgrade() -> None:
+    for table, column, default in TIMESTAMP_DEFAULTS:
+        op.alter_column(table, column, server_default=sa.text(default))
+
+
+def downgrade() -> None:
+    for table, column, _ in TIMESTAMP_DEFAULTS:
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,66 @@
+"""store enums as varchar with check constraints
+
+Revision ID: 7a4d2e8c5f13
+Revises: 3c9e1f0a7b21
+Create Date: 2026-10-16 09:05:00.000000
+
+The native ENUM types stored member names (e.g. 'PAST_DUE'); the VARCHAR
+columns hold the enum values, which are the lower-cased names.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4d2e8c5f13'
+down_revision: Union[str, None] = '3c9e1f0a7b21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type, values, check constraint)
+ENUM_COLUMNS = (
+    ("chat_messages", "role", "messagerole", ("user", "assistant", "system"), "ck_chat_messages_role"),
+    ("project_files", "type", "filetype", ("file", "directory"), "ck_project_files_type"),
+    (
+        "subscriptions", "status", "subscriptionstatus",
+        ("active", "past_due", "canceled", "unpaid", "trialing", "incomplete", "incomplete_expired"),
+        "ck_subscriptions_status",
+    ),
+    (
+        "payments", "status", "paymentstatus",
+        ("pending", "processing", "succeeded", "failed", "canceled", "refunded"),
+        "ck_payments_status",
+    ),
+)
+
+
+def allowed_values(values) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    for table, column, enum_name, values, check_name in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=20),
+            postgresql_using=f"lower({column}::text)",
+        )
+        op.execute(f"DROP TYPE {enum_name}")
+        op.create_check_constraint(check_name, table, f"{column} IN ({allowed_values(values)})")
+
+
+def downgrade() -> None:
+    for table, column, enum_name, values, check_name in ENUM_COLUMNS:
+        op.drop_constraint(check_name, table, type_="check")
+        names = tuple(value.upper() for value in values)
+        sa.Enum(*names, name=enum_name).create(op.get_bind())
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Enum(*names, name=enum_name),
+            postgresql_using=f"upper({column})::{enum_name}",
+        )
@@ -0,0 +1,28 @@
+"""add subscription expiry and payment history indexes
+
+Revision ID: 8e3f5a9b2c17
+Revises: 5d2a7c1e4b86
+Create Date: 2026-10-16 09:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e3f5a9b2c17'
+down_revision: Union[str, None] = '5d2a7c1e4b86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_subs_status_period_end", "subscriptions", ["status", "current_period_end"])
+    op.create_index("ix_payments_user_created", "payments", ["user_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_payments_user_created", table_name="payments")
+    op.drop_index("ix_subs_status_period_end", table_name="subscriptions")
@@ -0,0 +1,31 @@
+"""user timestamps not null with server defaults
+
+Revision ID: 9f2c6b4a1d83
+Revises: 4a8b3c5d6e79
+Create Date: 2026-10-16 09:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f2c6b4a1d83'
+down_revision: Union[str, None] = '4a8b3c5d6e79'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Backfill before NOT NULL; a missing updated_at falls back to created_at
+    op.execute("UPDATE users SET created_at = now() WHERE created_at IS NULL")
+    op.execute("UPDATE users SET updated_at = created_at WHERE updated_at IS NULL")
+    op.alter_column("users", "created_at", nullable=False, server_default=sa.text("now()"))
+    op.alter_column("users", "updated_at", nullable=False, server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    op.alter_column("users", "updated_at", nullable=True, server_default=None)
+    op.alter_column("users", "created_at", nullable=True, server_default=None)
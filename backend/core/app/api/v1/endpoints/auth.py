@@ -5,7 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, func
 from pydantic import BaseModel
 
 from app.api import deps
@@ -39,7 +39,7 @@ async def signup(
     # Check if user already exists
     result = await db.execute(
         select(User).where(
-            or_(User.email == user_in.email, User.username == user_in.username)
+            or_(func.lower(User.email) == user_in.email.lower(), User.username == user_in.username)
         )
     )
     if result.scalar_one_or_none():
@@ -53,7 +53,7 @@ async def signup(
         email=user_in.email,
         username=user_in.username,
         full_name=user_in.full_name,
-        hashed_password=security.get_password_hash(user_in.password),
+        hashed_password=await security.get_password_hash_async(user_in.password),
         is_active=True,
         is_verified=False,  # Email verification can be added later
     )
@@ -76,11 +76,11 @@ async def signin(
     """
     # Find user by email
     result = await db.execute(
-        select(User).where(User.email == form_data.username)
+        select(User).where(func.lower(User.email) == form_data.username.lower())
     )
     user = result.scalar_one_or_none()
     
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    if not user or not await security.verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -102,7 +102,7 @@ async def signin(
     # Create session
     session = Session(
         user_id=user.id,
-        refresh_token=refresh_token,
+        refresh_token=security.hash_token(refresh_token),
         access_token_jti=jti,
         ip_address=request.client.host if request.client else None,
         user_agent=request.headers.get("User-Agent"),
@@ -158,16 +158,20 @@ async def refresh_token(
             detail="Invalid or expired token"
         )
     
-    # Find session
+    # Find session by token hash, then confirm in constant time
     result = await db.execute(
         select(Session).where(
-            Session.refresh_token == token_data.refresh_token,
+            Session.refresh_token == security.hash_token(token_data.refresh_token),
             Session.user_id == UUID(user_id)
         )
     )
     session = result.scalar_one_or_none()
     
-    if not session or session.is_expired:
+    if (
+        not session
+        or not security.token_matches(token_data.refresh_token, session.refresh_token)
+        or session.is_expired
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired session"
@@ -218,7 +222,7 @@ async def logout(
         # Remove specific session
         result = await db.execute(
             select(Session).where(
-                Session.refresh_token == token_data.refresh_token,
+                Session.refresh_token == security.hash_token(token_data.refresh_token),
                 Session.user_id == current_user.id
             )
         )
@@ -260,7 +264,7 @@ async def google_oauth(
     
     # Check if user exists
     result = await db.execute(
-        select(User).where(User.email == email)
+        select(User).where(func.lower(User.email) == email.lower())
     )
     user = result.scalar_one_or_none()
     
@@ -273,7 +277,7 @@ async def google_oauth(
             avatar_url=user_data.get("image", ""),
             google_id=user_data.get("google_id", ""),
             # Set a random password for OAuth users
-            hashed_password=security.get_password_hash(security.jwt.encode({"email": email}, settings.SECRET_KEY)),
+            hashed_password=await security.get_password_hash_async(security.jwt.encode({"email": email}, settings.SECRET_KEY)),
             is_active=True,
         )
         db.add(user)
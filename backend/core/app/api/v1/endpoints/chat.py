@@ -1,16 +1,19 @@
-from typing import Any, List
+from typing import Any, List, Optional
 from datetime import datetime
 from uuid import UUID
 import json
 import re
 
+import orjson
+
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import select, and_, func
+from sqlalchemy.orm import selectinload
 
 from app.api import deps
-from app.db.session import get_db
+from app.db.session import get_db, get_session_factory
 from app.models import User, Project, ChatSession, ChatMessage, CodeGeneration, MessageRole, ProjectFile
 from app.schemas.chat import (
     ChatSession as ChatSessionSchema,
@@ -32,6 +35,18 @@ from app.core.config import settings
 
 router = APIRouter()
 
+# Columns serialized by the streaming message listing
+CHAT_MESSAGE_COLUMNS = (
+    ChatMessage.id,
+    ChatMessage.session_id,
+    ChatMessage.role,
+    ChatMessage.content,
+    ChatMessage.file_references,
+    ChatMessage.code_blocks,
+    ChatMessage.token_count,
+    ChatMessage.created_at,
+)
+
 
 def extract_code_blocks(content: str) -> List[dict]:
     """Extract code blocks from message content"""
@@ -50,6 +65,13 @@ def extract_code_blocks(content: str) -> List[dict]:
     return code_blocks
 
 
+def serialize_file_references(file_references: Optional[tuple]) -> Optional[List[str]]:
+    """Convert referenced file IDs to strings for the JSON column"""
+    if file_references is None:
+        return None
+    return [str(file_id) for file_id in file_references]
+
+
 async def verify_project_access(
     project_id: UUID,
     user_id: UUID,
@@ -138,8 +160,10 @@ async def get_chat_session(
     """
     project = await verify_project_access(project_id, current_user.id, db)
     
+    # Messages are batch-loaded (ordered by created_at) in one extra SELECT
     result = await db.execute(
         select(ChatSession)
+        .options(selectinload(ChatSession.messages))
         .where(
             and_(
                 ChatSession.id == session_id,
@@ -155,18 +179,56 @@ async def get_chat_session(
             detail="Chat session not found"
         )
     
-    # Load messages
-    messages_result = await db.execute(
-        select(ChatMessage)
-        .where(ChatMessage.session_id == session_id)
-        .order_by(ChatMessage.created_at)
-    )
-    messages = messages_result.scalars().all()
+    return session
+
+
+@router.get("/projects/{project_id}/chat/sessions/{session_id}/messages/stream")
+async def stream_chat_session_messages(
+    *,
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    project_id: UUID,
+    session_id: UUID,
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Stream all messages of a chat session as JSON without loading them into memory.
+    Intended for long sessions; get_chat_session stays the default for small ones.
+    """
+    project = await verify_project_access(project_id, current_user.id, db)
     
-    return ChatSessionWithMessages(
-        **session.__dict__,
-        messages=messages
+    session_result = await db.execute(
+        select(ChatSession.id).where(
+            and_(
+                ChatSession.id == session_id,
+                ChatSession.project_id == project_id
+            )
+        )
     )
+    if session_result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat session not found"
+        )
+    
+    async def generate():
+        # The request's session is closed before the body streams; use a dedicated one
+        async with session_factory() as stream_db:
+            result = await stream_db.stream(
+                select(*CHAT_MESSAGE_COLUMNS)
+                .where(ChatMessage.session_id == session_id)
+                .order_by(ChatMessage.created_at)
+                .execution_options(yield_per=256)
+            )
+            yield b'{"session_id":' + orjson.dumps(session_id) + b',"messages":['
+            separator = b""
+            async for row in result:
+                # asyncpg returns its own UUID type, which orjson only encodes via `default`
+                yield separator + orjson.dumps(dict(row._mapping), default=str)
+                separator = b","
+            yield b"]}"
+    
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 @router.post("/projects/{project_id}/chat/sessions/{session_id}/messages", response_model=ChatMessageSchema)
@@ -205,7 +267,7 @@ async def send_message(
         session_id=session_id,
         role=MessageRole.USER,
         content=message_in.content,
-        file_references=message_in.file_references
+        file_references=serialize_file_references(message_in.file_references)
     )
     db.add(user_message)
     
@@ -222,7 +284,7 @@ async def send_message(
     messages = []
     for msg in history:
         messages.append({
-            "role": msg.role.value,
+            "role": msg.role,
             "content": msg.content
         })
     
@@ -235,18 +297,25 @@ async def send_message(
     # Get file context if referenced
     file_context = ""
     if message_in.file_references:
-        for file_id in message_in.file_references[:5]:  # Max 5 files
-            file_result = await db.execute(
-                select(ProjectFile).where(
-                    and_(
-                        ProjectFile.id == file_id,
-                        ProjectFile.project_id == project_id
-                    )
+        file_ids = message_in.file_references[:5]  # Max 5 files
+        file_result = await db.execute(
+            select(
+                ProjectFile.id,
+                ProjectFile.path,
+                ProjectFile.language,
+                func.substr(ProjectFile.content, 1, 2000).label("content")
+            ).where(
+                and_(
+                    ProjectFile.id.in_(file_ids),
+                    ProjectFile.project_id == project_id
                 )
             )
-            file = file_result.scalar_one_or_none()
+        )
+        files_by_id = {row.id: row for row in file_result}
+        for file_id in file_ids:  # Keep the user's reference order
+            file = files_by_id.get(file_id)
             if file and file.content:
-                file_context += f"\n\nFile: {file.path}\n```{file.language or ''}\n{file.content[:2000]}\n```"
+                file_context += f"\n\nFile: {file.path}\n```{file.language or ''}\n{file.content}\n```"
     
     # Create system prompt
     system_prompt = f"""You are an AI software engineering assistant for a project using {project.language}.
@@ -328,7 +397,7 @@ async def stream_chat_response(
         session_id=request.session_id,
         role=MessageRole.USER,
         content=request.message,
-        file_references=request.file_references
+        file_references=serialize_file_references(request.file_references)
     )
     db.add(user_message)
     await db.commit()
@@ -346,7 +415,7 @@ async def stream_chat_response(
     messages = []
     for msg in history[:-1]:  # Exclude the just-added message
         messages.append({
-            "role": msg.role.value,
+            "role": msg.role,
             "content": msg.content
         })
     messages.append({
@@ -1,4 +1,5 @@
 from typing import Any, List, Optional
+from collections import defaultdict
 from datetime import datetime
 from uuid import UUID
 import os
@@ -8,9 +9,11 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, func
+from sqlalchemy.orm import aliased
 import aiofiles
 
 from app.api import deps
+from app.core.config import settings
 from app.db.session import get_db
 from app.models import User, Project, ProjectFile, FileType
 from app.schemas.project_file import (
@@ -19,11 +22,29 @@ from app.schemas.project_file import (
     ProjectFileUpdate,
     ProjectFileMove,
     ProjectFileList,
+    ProjectFileSummary,
     ProjectFileTree
 )
 
 router = APIRouter()
 
+# Metadata-only projection for listings; file bodies are loaded only for single-file reads
+FILE_LISTING_COLUMNS = (
+    ProjectFile.id,
+    ProjectFile.project_id,
+    ProjectFile.parent_id,
+    ProjectFile.name,
+    ProjectFile.path,
+    ProjectFile.type,
+    ProjectFile.language,
+    ProjectFile.encoding,
+    ProjectFile.size_bytes,
+    ProjectFile.is_binary,
+    ProjectFile.mime_type,
+    ProjectFile.created_at,
+    ProjectFile.updated_at,
+)
+
 
 async def verify_project_access(
     project_id: UUID,
@@ -50,6 +71,15 @@ async def verify_project_access(
     return project
 
 
+def check_file_size(size_bytes: int) -> None:
+    """Reject file content above the per-file size limit"""
+    if size_bytes > settings.MAX_FILE_SIZE_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large (max {settings.MAX_FILE_SIZE_BYTES} bytes)"
+        )
+
+
 def get_file_language(filename: str) -> Optional[str]:
     """Detect programming language from file extension"""
     ext_map = {
@@ -107,14 +137,14 @@ async def list_project_files(
     project = await verify_project_access(project_id, current_user.id, db)
     
     # Build query
-    query = select(ProjectFile).where(ProjectFile.project_id == project_id)
+    query = select(*FILE_LISTING_COLUMNS).where(ProjectFile.project_id == project_id)
     
     if path:
         # Filter by path prefix
         query = query.where(ProjectFile.path.startswith(path))
     
     result = await db.execute(query.order_by(ProjectFile.path))
-    files = result.scalars().all()
+    files = [ProjectFileSummary.model_validate(row._mapping) for row in result]
     
     # Calculate statistics
     total_files = sum(1 for f in files if f.type == FileType.FILE)
@@ -141,38 +171,58 @@ async def get_file_tree(
     """
     project = await verify_project_access(project_id, current_user.id, db)
     
-    # Get all files
-    result = await db.execute(
-        select(ProjectFile)
-        .where(ProjectFile.project_id == project_id)
-        .order_by(ProjectFile.path)
+    # Entries whose parent is not a folder of this project (orphans) are shown at the root
+    parent = aliased(ProjectFile)
+    has_parent_in_project = (
+        select(parent.id)
+        .where(
+            and_(
+                parent.id == ProjectFile.parent_id,
+                parent.project_id == project_id
+            )
+        )
+        .exists()
+    )
+    
+    # Walk the whole tree from the root entries in a single recursive query
+    tree_cte = (
+        select(*FILE_LISTING_COLUMNS)
+        .where(
+            and_(
+                ProjectFile.project_id == project_id,
+                ~has_parent_in_project
+            )
+        )
+        .cte("file_tree", recursive=True)
+    )
+    tree_cte = tree_cte.union_all(
+        select(*FILE_LISTING_COLUMNS).where(
+            and_(
+                ProjectFile.parent_id == tree_cte.c.id,
+                ProjectFile.project_id == project_id
+            )
+        )
     )
-    files = result.scalars().all()
+    result = await db.execute(select(tree_cte))
     
-    # Build tree structure
-    file_map = {f.id: f for f in files}
+    # Reassemble parent/child links in a single pass
+    nodes = [ProjectFileTree.model_validate(row._mapping) for row in result]
+    node_ids = {node.id for node in nodes}
+    children_by_parent = defaultdict(list)
     roots = []
+    for node in nodes:
+        if node.parent_id in node_ids:
+            children_by_parent[node.parent_id].append(node)
+        else:
+            roots.append(node)
     
-    for file in files:
-        if file.parent_id is None:
-            roots.append(file)
+    def sort_key(node: ProjectFileTree):
+        return (node.type != FileType.DIRECTORY, node.name.lower())
     
-    def build_tree(node: ProjectFile) -> ProjectFileTree:
-        children = [
-            build_tree(child) 
-            for child in files 
-            if child.parent_id == node.id
-        ]
-        
-        tree_node = ProjectFileTree(**node.__dict__)
-        tree_node.children = sorted(
-            children, 
-            key=lambda x: (x.type != FileType.DIRECTORY, x.name.lower())
-        )
-        return tree_node
+    for node in nodes:
+        node.children = sorted(children_by_parent.get(node.id, []), key=sort_key)
     
-    tree = [build_tree(root) for root in roots]
-    return sorted(tree, key=lambda x: (x.type != FileType.DIRECTORY, x.name.lower()))
+    return sorted(roots, key=sort_key)
 
 
 @router.post("/{project_id}/files", response_model=ProjectFileSchema)
@@ -188,6 +238,10 @@ async def create_file(
     """
     project = await verify_project_access(project_id, current_user.id, db)
     
+    # Only after authorization, so the size limit isn't revealed to non-owners
+    size_bytes = len(file_in.content.encode()) if file_in.content else 0
+    check_file_size(size_bytes)
+    
     # Check file count limit
     if file_in.type == FileType.FILE:
         file_count_result = await db.execute(
@@ -224,10 +278,10 @@ async def create_file(
     
     # Create file
     db_file = ProjectFile(
-        **file_in.dict(),
+        **file_in.model_dump(),
         project_id=project_id,
         language=get_file_language(file_in.name) if file_in.type == FileType.FILE else None,
-        size_bytes=len(file_in.content.encode()) if file_in.content else 0,
+        size_bytes=size_bytes,
         mime_type=mimetypes.guess_type(file_in.name)[0] if file_in.type == FileType.FILE else None
     )
     
@@ -315,10 +369,11 @@ async def update_file(
     # Update size if content changed
     old_size = file.size_bytes
     
-    update_data = file_in.dict(exclude_unset=True)
+    update_data = file_in.model_dump(exclude_unset=True)
     
     if "content" in update_data and update_data["content"] is not None:
         new_size = len(update_data["content"].encode())
+        check_file_size(new_size)
         size_diff = new_size - old_size
         
         # Check size limit
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, update, delete, and_, func
 
 from app.api import deps
 from app.db.session import get_db
@@ -20,6 +20,22 @@ from app.core.cache import cache, cached, project_cache_key
 
 router = APIRouter()
 
+# Columns needed to build the Project response schema for listings
+PROJECT_LISTING_COLUMNS = (
+    Project.id,
+    Project.owner_id,
+    Project.name,
+    Project.description,
+    Project.language,
+    Project.template,
+    Project.max_files,
+    Project.total_size_kb,
+    Project.max_size_kb,
+    Project.created_at,
+    Project.updated_at,
+    Project.last_accessed_at,
+)
+
 
 @router.get("/", response_model=ProjectList)
 async def read_projects(
@@ -42,20 +58,30 @@ async def read_projects(
     )
     total = count_result.scalar_one()
     
-    # Get projects
+    # Get projects as plain rows (no ORM identity-map overhead)
     result = await db.execute(
-        select(Project)
+        select(*PROJECT_LISTING_COLUMNS)
         .where(Project.owner_id == current_user.id)
         .offset(skip)
         .limit(page_size)
         .order_by(Project.updated_at.desc())
     )
-    projects = result.scalars().all()
+    rows = result.all()
     
-    # Update last accessed time for retrieved projects
-    for project in projects:
-        project.last_accessed_at = datetime.utcnow()
-    await db.commit()
+    # Update last accessed time for retrieved projects in one statement
+    accessed_at = datetime.utcnow()
+    if rows:
+        await db.execute(
+            update(Project)
+            .where(Project.id.in_([row.id for row in rows]))
+            .values(last_accessed_at=accessed_at)
+        )
+        await db.commit()
+    
+    projects = [
+        ProjectSchema.model_validate({**row._mapping, "last_accessed_at": accessed_at})
+        for row in rows
+    ]
     
     return ProjectList(
         projects=projects,
@@ -98,7 +124,7 @@ async def create_project(
         max_size_kb = 1048576  # 1GB
     
     project = Project(
-        **project_in.dict(),
+        **project_in.model_dump(),
         owner_id=current_user.id,
         max_files=max_files,
         max_size_kb=max_size_kb
@@ -110,7 +136,11 @@ async def create_project(
 
 
 @router.get("/{project_id}", response_model=ProjectSchema)
-@cached(expire=300, key_func=lambda project_id, **kwargs: project_cache_key(str(project_id)))
+@cached(
+    expire=300,
+    # Keyed by owner too, so a cache hit never bypasses the ownership check
+    key_func=lambda project_id, current_user, **kwargs: project_cache_key(f"{current_user.id}:{project_id}"),
+)
 async def read_project(
     *,
     db: AsyncSession = Depends(get_db),
@@ -140,7 +170,8 @@ async def read_project(
     project.last_accessed_at = datetime.utcnow()
     await db.commit()
     
-    return project
+    # Cached as JSON, so return the schema dump rather than the ORM object
+    return ProjectSchema.model_validate(project).model_dump(mode="json")
 
 
 @router.put("/{project_id}", response_model=ProjectSchema)
@@ -154,13 +185,19 @@ async def update_project(
     """
     Update project
     """
+    update_data = project_in.model_dump(exclude_unset=True)
+    
+    # Single UPDATE ... RETURNING instead of SELECT + mutate + commit + refresh
     result = await db.execute(
-        select(Project).where(
+        update(Project)
+        .where(
             and_(
                 Project.id == project_id,
                 Project.owner_id == current_user.id
             )
         )
+        .values(**update_data, updated_at=func.now())
+        .returning(Project)
     )
     project = result.scalar_one_or_none()
     
@@ -170,15 +207,10 @@ async def update_project(
             detail="Project not found"
         )
     
-    update_data = project_in.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(project, field, value)
-    
     await db.commit()
-    await db.refresh(project)
     
-    # Invalidate cache
-    await cache.delete(project_cache_key(str(project_id)))
+    # Invalidate cache (through the decorator so the key prefix matches)
+    await read_project.invalidate(project_id=project_id, current_user=current_user)
     
     return project
 
@@ -193,28 +225,28 @@ async def delete_project(
     """
     Delete project and all associated data
     """
+    # Files, chats and code generations are removed by ON DELETE CASCADE
     result = await db.execute(
-        select(Project).where(
+        delete(Project)
+        .where(
             and_(
                 Project.id == project_id,
                 Project.owner_id == current_user.id
             )
         )
+        .returning(Project.id)
     )
-    project = result.scalar_one_or_none()
     
-    if not project:
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
     
-    # Delete project (cascades to files and chats)
-    await db.delete(project)
     await db.commit()
     
     # Invalidate related caches
-    await cache.delete(project_cache_key(str(project_id)))
+    await read_project.invalidate(project_id=project_id, current_user=current_user)
     await cache.invalidate_pattern(f"file_tree:{project_id}*")
     await cache.invalidate_pattern(f"file:{project_id}:*")
     
@@ -248,20 +280,17 @@ async def get_project_stats(
             detail="Project not found"
         )
     
-    # Get file statistics
+    # Get file statistics and last activity in one pass over the project's files
     from app.models import ProjectFile
+    is_file = ProjectFile.type == "file"
     file_result = await db.execute(
         select(
-            func.count(ProjectFile.id),
-            func.sum(ProjectFile.size_bytes)
-        ).where(
-            and_(
-                ProjectFile.project_id == project_id,
-                ProjectFile.type == "file"
-            )
-        )
+            func.count(ProjectFile.id).filter(is_file),
+            func.sum(ProjectFile.size_bytes).filter(is_file),
+            func.max(ProjectFile.updated_at)
+        ).where(ProjectFile.project_id == project_id)
     )
-    total_files, total_size = file_result.one()
+    total_files, total_size, last_file_update = file_result.one()
     
     # Get language breakdown
     lang_result = await db.execute(
@@ -271,19 +300,14 @@ async def get_project_stats(
         ).where(
             and_(
                 ProjectFile.project_id == project_id,
-                ProjectFile.type == "file",
+                is_file,
                 ProjectFile.language.isnot(None)
             )
         ).group_by(ProjectFile.language)
     )
     language_breakdown = {lang: count for lang, count in lang_result}
     
-    # Get last activity
-    activity_result = await db.execute(
-        select(func.max(ProjectFile.updated_at))
-        .where(ProjectFile.project_id == project_id)
-    )
-    last_activity = activity_result.scalar_one_or_none() or project.updated_at
+    last_activity = last_file_update or project.updated_at
     
     return ProjectStats(
         total_files=total_files or 0,
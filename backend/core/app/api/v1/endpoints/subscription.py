@@ -6,16 +6,18 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 import stripe
 
 from app.api import deps
 from app.db.session import get_db
-from app.models import User, Subscription, Payment, PriceProduct, WebhookEvent, SubscriptionPlan, SubscriptionStatus, PaymentStatus
+from app.models import User, Project, Subscription, Payment, PriceProduct, WebhookEvent, SubscriptionPlan, SubscriptionStatus, PaymentStatus
 from app.schemas.subscription import (
     Subscription as SubscriptionSchema,
     SubscriptionCreate,
     SubscriptionUpdate,
     SubscriptionInfo,
+    UsageStats,
     Payment as PaymentSchema,
     PaymentList,
     PriceProduct as PriceProductSchema,
@@ -30,6 +32,45 @@ from app.core.config import settings
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Subscription statuses that keep the user on the paid plan
+PAID_SUBSCRIPTION_STATUSES = frozenset({
+    SubscriptionStatus.ACTIVE,
+    SubscriptionStatus.TRIALING,
+    SubscriptionStatus.PAST_DUE,
+})
+
+# Columns needed to build the response schemas for listings
+PRICE_LISTING_COLUMNS = (
+    PriceProduct.id,
+    PriceProduct.stripe_price_id,
+    PriceProduct.stripe_product_id,
+    PriceProduct.name,
+    PriceProduct.description,
+    PriceProduct.amount,
+    PriceProduct.currency,
+    PriceProduct.interval,
+    PriceProduct.interval_count,
+    PriceProduct.features,
+    PriceProduct.active,
+    PriceProduct.created_at,
+)
+
+PAYMENT_LISTING_COLUMNS = (
+    Payment.id,
+    Payment.user_id,
+    Payment.subscription_id,
+    Payment.stripe_payment_intent_id,
+    Payment.stripe_invoice_id,
+    Payment.amount,
+    Payment.currency,
+    Payment.status,
+    Payment.description,
+    Payment.invoice_pdf,
+    Payment.receipt_url,
+    Payment.created_at,
+    Payment.paid_at,
+)
+
 
 @router.get("/prices", response_model=List[PriceProductSchema])
 async def list_available_prices(
@@ -41,13 +82,12 @@ async def list_available_prices(
     List available subscription prices
     """
     result = await db.execute(
-        select(PriceProduct)
+        select(*PRICE_LISTING_COLUMNS)
         .where(PriceProduct.active == True)
         .order_by(PriceProduct.amount)
     )
-    prices = result.scalars().all()
     
-    return prices
+    return [PriceProductSchema.model_validate(row._mapping) for row in result]
 
 
 @router.get("/subscription", response_model=SubscriptionInfo)
@@ -59,22 +99,39 @@ async def get_subscription_info(
     """
     Get current user's subscription information
     """
-    # Get subscription
+    # Subscription plus project aggregates in a single round trip
+    project_count = (
+        select(func.count(Project.id))
+        .where(Project.owner_id == User.id)
+        .scalar_subquery()
+    )
+    storage_used_kb = (
+        select(func.coalesce(func.sum(Project.total_size_kb), 0))
+        .where(Project.owner_id == User.id)
+        .scalar_subquery()
+    )
     result = await db.execute(
-        select(Subscription)
-        .where(Subscription.user_id == current_user.id)
+        select(
+            Subscription,
+            project_count.label("project_count"),
+            storage_used_kb.label("storage_used_kb"),
+        )
+        .select_from(User)
+        .outerjoin(Subscription, Subscription.user_id == User.id)
+        .where(User.id == current_user.id)
     )
-    subscription = result.scalar_one_or_none()
+    subscription, projects, storage_kb = result.one()
     
     # Calculate usage
-    usage = {
-        "projects": len(current_user.projects),
-        "max_projects": 1 if current_user.subscription_plan == SubscriptionPlan.FREE else -1,
-        "tokens_used": current_user.tokens_used,
-        "tokens_limit": current_user.tokens_limit,
-        "storage_used_mb": sum(p.total_size_kb for p in current_user.projects) / 1024,
-        "storage_limit_mb": 10 if current_user.subscription_plan == SubscriptionPlan.FREE else 1024,
-    }
+    usage = UsageStats(
+        projects=projects,
+        max_projects=1 if current_user.subscription_plan == SubscriptionPlan.FREE else -1,
+        tokens_used=current_user.tokens_used,
+        tokens_limit=current_user.tokens_limit,
+        storage_used_mb=storage_kb / 1024,
+        storage_limit_mb=10 if current_user.subscription_plan == SubscriptionPlan.FREE else 1024,
+        resets_at=current_user.tokens_reset_at,
+    )
     
     return SubscriptionInfo(
         has_subscription=subscription is not None,
@@ -335,13 +392,13 @@ async def list_payments(
     
     # Get payments
     result = await db.execute(
-        select(Payment)
+        select(*PAYMENT_LISTING_COLUMNS)
         .where(Payment.user_id == current_user.id)
         .offset(skip)
         .limit(page_size)
         .order_by(Payment.created_at.desc())
     )
-    payments = result.scalars().all()
+    payments = [PaymentSchema.model_validate(row._mapping) for row in result]
     
     return PaymentList(
         payments=payments,
@@ -394,13 +451,13 @@ async def stripe_webhook(
                 await handle_checkout_completed(db, event.data.object)
             
             elif event.type == "customer.subscription.created":
-                await handle_subscription_created(db, event.data.object)
+                await handle_subscription_created(db, event.data.object, event.created)
             
             elif event.type == "customer.subscription.updated":
-                await handle_subscription_updated(db, event.data.object)
+                await handle_subscription_updated(db, event.data.object, event.created)
             
             elif event.type == "customer.subscription.deleted":
-                await handle_subscription_deleted(db, event.data.object)
+                await handle_subscription_deleted(db, event.data.object, event.created)
             
             elif event.type == "invoice.payment_succeeded":
                 await handle_payment_succeeded(db, event.data.object)
@@ -458,70 +515,98 @@ async def handle_checkout_completed(db: AsyncSession, session: dict):
         user.subscription_plan = SubscriptionPlan.PRO
 
 
-async def handle_subscription_created(db: AsyncSession, subscription: dict):
-    """Handle new subscription creation"""
-    logger.info(f"Processing customer.subscription.created: {subscription['id']}")
+def to_datetime(timestamp):
+    """Convert a Stripe epoch timestamp to an aware UTC datetime"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp else None
+
+
+async def upsert_subscription(db: AsyncSession, user_id: UUID, subscription: dict, event_created: int) -> bool:
+    """
+    Insert or refresh the user's subscription row from a Stripe subscription object.
     
-    # Get user by customer ID
+    The row remembers the `created` time of the webhook event it was built from,
+    and only a strictly newer event may overwrite it, so out-of-order deliveries
+    and retries never regress the stored status. Returns whether the event was applied.
+    """
+    price = subscription["items"]["data"][0]["price"]
+    values = {
+        "stripe_subscription_id": subscription["id"],
+        "stripe_price_id": price["id"],
+        "stripe_product_id": price["product"],
+        "status": stripe_client.map_subscription_status(subscription["status"]).value,
+        "current_period_start": to_datetime(subscription["current_period_start"]),
+        "current_period_end": to_datetime(subscription["current_period_end"]),
+        "cancel_at": to_datetime(subscription.get("cancel_at")),
+        "canceled_at": to_datetime(subscription.get("canceled_at")),
+        "trial_end": to_datetime(subscription.get("trial_end")),
+        "stripe_event_created_at": to_datetime(event_created),
+    }
+    
+    stmt = pg_insert(Subscription).values(user_id=user_id, **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Subscription.user_id],
+        set_={**values, "updated_at": func.now()},
+        where=or_(
+            Subscription.stripe_event_created_at.is_(None),
+            Subscription.stripe_event_created_at < stmt.excluded.stripe_event_created_at,
+        ),
+    ).returning(Subscription.id)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none() is not None
+
+
+def sync_user_plan(user: User, subscription: dict) -> None:
+    """Derive the user's plan from the Stripe subscription status just stored"""
+    status = stripe_client.map_subscription_status(subscription["status"])
+    if status in PAID_SUBSCRIPTION_STATUSES:
+        user.subscription_plan = SubscriptionPlan.PRO
+        user.stripe_subscription_id = subscription["id"]
+    else:
+        user.subscription_plan = SubscriptionPlan.FREE
+        user.stripe_subscription_id = None
+
+
+async def get_user_by_customer_id(db: AsyncSession, customer_id: str):
+    """Get user by Stripe customer ID"""
     result = await db.execute(
-        select(User).where(User.stripe_customer_id == subscription["customer"])
+        select(User).where(User.stripe_customer_id == customer_id)
     )
-    user = result.scalar_one_or_none()
+    return result.scalar_one_or_none()
+
+
+async def handle_subscription_created(db: AsyncSession, subscription: dict, event_created: int):
+    """Handle new subscription creation"""
+    logger.info(f"Processing customer.subscription.created: {subscription['id']}")
     
+    user = await get_user_by_customer_id(db, subscription["customer"])
     if not user:
         logger.error(f"User with customer_id {subscription['customer']} not found")
         return
     
-    # Create subscription record
-    sub = Subscription(
-        user_id=user.id,
-        stripe_subscription_id=subscription["id"],
-        stripe_price_id=subscription["items"]["data"][0]["price"]["id"],
-        stripe_product_id=subscription["items"]["data"][0]["price"]["product"],
-        status=stripe_client.map_subscription_status(subscription["status"]),
-        current_period_start=datetime.fromtimestamp(subscription["current_period_start"], tz=timezone.utc),
-        current_period_end=datetime.fromtimestamp(subscription["current_period_end"], tz=timezone.utc),
-        trial_end=datetime.fromtimestamp(subscription["trial_end"], tz=timezone.utc) if subscription.get("trial_end") else None,
-    )
-    db.add(sub)
-    
-    # Update user
-    user.subscription_plan = SubscriptionPlan.PRO
-    user.stripe_subscription_id = subscription["id"]
+    # Only touch the user when the event was applied, so the plan follows the stored status
+    if await upsert_subscription(db, user.id, subscription, event_created):
+        sync_user_plan(user, subscription)
+    else:
+        logger.info(f"Ignoring stale event for subscription {subscription['id']}")
 
 
-async def handle_subscription_updated(db: AsyncSession, subscription: dict):
+async def handle_subscription_updated(db: AsyncSession, subscription: dict, event_created: int):
     """Handle subscription updates"""
     logger.info(f"Processing customer.subscription.updated: {subscription['id']}")
     
-    # Get subscription
-    result = await db.execute(
-        select(Subscription)
-        .where(Subscription.stripe_subscription_id == subscription["id"])
-    )
-    sub = result.scalar_one_or_none()
-    
-    if not sub:
-        logger.error(f"Subscription {subscription['id']} not found")
+    user = await get_user_by_customer_id(db, subscription["customer"])
+    if not user:
+        logger.error(f"User with customer_id {subscription['customer']} not found")
         return
     
-    # Update subscription
-    sub.status = stripe_client.map_subscription_status(subscription["status"])
-    sub.current_period_start = datetime.fromtimestamp(subscription["current_period_start"], tz=timezone.utc)
-    sub.current_period_end = datetime.fromtimestamp(subscription["current_period_end"], tz=timezone.utc)
-    
-    if subscription.get("cancel_at"):
-        sub.cancel_at = datetime.fromtimestamp(subscription["cancel_at"], tz=timezone.utc)
+    # Upsert so an update arriving before its created event still lands
+    if await upsert_subscription(db, user.id, subscription, event_created):
+        sync_user_plan(user, subscription)
     else:
-        sub.cancel_at = None
-        
-    if subscription.get("canceled_at"):
-        sub.canceled_at = datetime.fromtimestamp(subscription["canceled_at"], tz=timezone.utc)
-    else:
-        sub.canceled_at = None
+        logger.info(f"Ignoring stale event for subscription {subscription['id']}")
 
 
-async def handle_subscription_deleted(db: AsyncSession, subscription: dict):
+async def handle_subscription_deleted(db: AsyncSession, subscription: dict, event_created: int):
     """Handle subscription deletion"""
     logger.info(f"Processing customer.subscription.deleted: {subscription['id']}")
     
@@ -536,8 +621,14 @@ async def handle_subscription_deleted(db: AsyncSession, subscription: dict):
         logger.error(f"Subscription {subscription['id']} not found")
         return
     
-    # Update subscription status
+    # Same ordering rule as upsert_subscription; stamp the event so older updates can't revive it
+    deleted_at = to_datetime(event_created)
+    if sub.stripe_event_created_at is not None and sub.stripe_event_created_at >= deleted_at:
+        logger.info(f"Ignoring stale event for subscription {subscription['id']}")
+        return
+    
     sub.status = SubscriptionStatus.CANCELED
+    sub.stripe_event_created_at = deleted_at
     
     # Update user
     user_result = await db.execute(
@@ -554,12 +645,7 @@ async def handle_payment_succeeded(db: AsyncSession, invoice: dict):
     """Handle successful payment"""
     logger.info(f"Processing invoice.payment_succeeded: {invoice['id']}")
     
-    # Get user by customer ID
-    result = await db.execute(
-        select(User).where(User.stripe_customer_id == invoice["customer"])
-    )
-    user = result.scalar_one_or_none()
-    
+    user = await get_user_by_customer_id(db, invoice["customer"])
     if not user:
         logger.error(f"User with customer_id {invoice['customer']} not found")
         return
@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 11  # ~250ms per hash on production CPUs; re-measure when hardware changes
     
     # Database
     DATABASE_URL: str
@@ -48,6 +49,9 @@ class Settings(BaseSettings):
     STRIPE_PRICE_ID_PRO_MONTHLY: str = ""
     STRIPE_PRICE_ID_PRO_YEARLY: str = ""
     
+    # Files
+    MAX_FILE_SIZE_BYTES: int = 5 * 1024 * 1024  # Per-file content limit
+    
     # Frontend
     FRONTEND_URL: str = "http://localhost:3000"
     
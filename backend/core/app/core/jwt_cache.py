@@ -0,0 +1,67 @@
+"""
+In-process cache of verified JWT payloads
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import threading
+import time
+
+
+class TokenCache:
+    """Small TTL-bounded LRU of decoded token payloads, keyed by token hash.
+
+    Only payloads that passed signature verification are stored, and an
+    entry never outlives the token's own ``exp`` claim.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Get cached payload for a token, or None if missing or stale"""
+        key = self._key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            deadline, payload = entry
+            if deadline <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return dict(payload)
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        """Cache a verified payload until min(now + ttl, exp)"""
+        now = time.time()
+        deadline = now + self.ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            deadline = min(deadline, exp)
+        if deadline <= now:
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (deadline, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached payloads"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global instance
+token_cache = TokenCache()
@@ -1,15 +1,23 @@
 from datetime import datetime, timedelta
 from typing import Any, Union, Optional
+import hashlib
+import hmac
 import secrets
 import uuid
 
+from fastapi.concurrency import run_in_threadpool
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.jwt_cache import token_cache
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 # JWT settings
 ALGORITHM = settings.ALGORITHM
@@ -74,10 +82,39 @@ def create_refresh_token(
     return encoded_jwt
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def hash_token(token: str) -> str:
+    """
+    Hash an opaque token (e.g. refresh token) for storage; only the digest is persisted
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def token_matches(token: str, token_hash: str) -> bool:
+    """
+    Constant-time check of a presented token against its stored hash
+    """
+    return hmac.compare_digest(hash_token(token), token_hash)
+
+
+def decode_token(token: str) -> dict:
+    """
+    Verify and decode a JWT, reusing recently verified payloads.
+    Raises JWTError for invalid or expired tokens (which are never cached).
+    """
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        token_cache.set(token, payload)
+    return payload
+
+
+def verify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
     """
     Verify a password against its hash
     """
+    if not hashed_password:
+        # OAuth-only accounts have no password to check
+        return False
     return pwd_context.verify(plain_password, hashed_password)
 
 
@@ -85,4 +122,20 @@ def get_password_hash(password: str) -> str:
     """
     Generate password hash
     """
-    return pwd_context.hash(password)
\ No newline at end of file
+    return pwd_context.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """
+    Verify a password in a worker thread so bcrypt doesn't block the event loop
+    """
+    if not hashed_password:
+        return False
+    return await run_in_threadpool(pwd_context.verify, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Generate password hash in a worker thread
+    """
+    return await run_in_threadpool(pwd_context.hash, password)
\ No newline at end of file
@@ -2,6 +2,9 @@
 Stripe API client integration
 """
 import stripe
+import asyncio
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import logging
@@ -14,10 +17,30 @@ logger = logging.getLogger(__name__)
 # Initialize Stripe only if configured
 if settings.STRIPE_SECRET_KEY and settings.STRIPE_SECRET_KEY != "":
     stripe.api_key = settings.STRIPE_SECRET_KEY
+    
+    # Shared keep-alive pool so concurrent calls don't queue on one connection.
+    # Retries are left to stripe.max_network_retries to avoid retrying twice.
+    _http_session = requests.Session()
+    _http_session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+    stripe.default_http_client = stripe.http_client.RequestsClient(session=_http_session)
 else:
     logger.warning("Stripe is not configured. Payment features will be disabled.")
     stripe.api_key = None
 
+# Stripe subscription status -> internal status
+_STATUS_MAP = {
+    "active": SubscriptionStatus.ACTIVE,
+    "past_due": SubscriptionStatus.PAST_DUE,
+    "canceled": SubscriptionStatus.CANCELED,
+    "unpaid": SubscriptionStatus.UNPAID,
+    "trialing": SubscriptionStatus.TRIALING,
+    "incomplete": SubscriptionStatus.INCOMPLETE,
+    "incomplete_expired": SubscriptionStatus.INCOMPLETE_EXPIRED,
+}
+
+# Max concurrent Stripe calls for bulk lookups
+BULK_FETCH_CONCURRENCY = 16
+
 
 class StripeClient:
     """Stripe API client wrapper"""
@@ -45,6 +68,19 @@ class StripeClient:
             logger.error(f"Failed to get customer {customer_id}: {str(e)}")
             return None
     
+    @staticmethod
+    async def get_customers_bulk(customer_ids: List[str]) -> Dict[str, Optional[stripe.Customer]]:
+        """Get many customers concurrently, keyed by ID (None for failed lookups)"""
+        semaphore = asyncio.Semaphore(BULK_FETCH_CONCURRENCY)
+        unique_ids = list(dict.fromkeys(customer_ids))
+        
+        async def fetch(customer_id: str) -> Optional[stripe.Customer]:
+            async with semaphore:
+                return await asyncio.to_thread(StripeClient.get_customer, customer_id)
+        
+        customers = await asyncio.gather(*(fetch(cid) for cid in unique_ids))
+        return dict(zip(unique_ids, customers))
+    
     @staticmethod
     def update_customer(customer_id: str, **kwargs) -> stripe.Customer:
         """Update customer details"""
@@ -213,16 +249,7 @@ class StripeClient:
     @staticmethod
     def map_subscription_status(stripe_status: str) -> SubscriptionStatus:
         """Map Stripe subscription status to our internal status"""
-        status_map = {
-            "active": SubscriptionStatus.ACTIVE,
-            "past_due": SubscriptionStatus.PAST_DUE,
-            "canceled": SubscriptionStatus.CANCELED,
-            "unpaid": SubscriptionStatus.UNPAID,
-            "trialing": SubscriptionStatus.TRIALING,
-            "incomplete": SubscriptionStatus.INCOMPLETE,
-            "incomplete_expired": SubscriptionStatus.INCOMPLETE_EXPIRED,
-        }
-        return status_map.get(stripe_status, SubscriptionStatus.CANCELED)
+        return _STATUS_MAP.get(stripe_status, SubscriptionStatus.CANCELED)
 
 
 # Global instance
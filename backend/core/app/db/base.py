@@ -5,4 +5,5 @@ from app.models.user import User  # noqa
 from app.models.session import Session  # noqa
 from app.models.project import Project  # noqa
 from app.models.project_file import ProjectFile  # noqa
-from app.models.chat import Chat  # noqa
\ No newline at end of file
+from app.models.chat import ChatSession, ChatMessage, CodeGeneration  # noqa
+from app.models.subscription import Subscription, Payment, PriceProduct, WebhookEvent  # noqa
@@ -1,3 +1,3 @@
-from sqlalchemy.ext.declarative import declarative_base
-
-Base = declarative_base()
\ No newline at end of file
+# Models share the declarative base from app.db.session so every table lands in
+# one metadata (app startup and the test schema both run create_all on it).
+from app.db.session import Base  # noqa
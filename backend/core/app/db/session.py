@@ -32,4 +32,9 @@ async def get_db() -> AsyncSession:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+# Dependency for code that opens its own sessions (e.g. streaming response bodies)
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    return AsyncSessionLocal
\ No newline at end of file
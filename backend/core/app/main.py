@@ -2,11 +2,12 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.core.config import settings
-from app.db.session import engine, Base
+from app.db.session import engine
 from app.api.v1.api import api_router
+from app.schemas import warm_schema_cache
 
 
 @asynccontextmanager
@@ -16,9 +17,11 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     print("Starting up...")
-    # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # The schema is managed by Alembic (`alembic upgrade head`), not created here
+    
+    # Build schemas and the OpenAPI document now rather than on first request
+    warm_schema_cache()
+    app.openapi()
     
     yield
     
@@ -32,6 +35,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
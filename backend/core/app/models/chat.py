@@ -1,7 +1,6 @@
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Boolean, Integer, JSON, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Boolean, Integer, JSON, Index, CheckConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.orm import relationship, validates
 import uuid
 import enum
 
@@ -17,12 +16,13 @@ class MessageRole(str, enum.Enum):
 class ChatSession(Base):
     """Chat session for a project"""
     __tablename__ = "chat_sessions"
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False, default="New Chat")
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     project = relationship("Project", back_populates="chat_sessions")
@@ -32,10 +32,15 @@ class ChatSession(Base):
 class ChatMessage(Base):
     """Individual chat message"""
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        Index("ix_chat_messages_session_created", "session_id", "created_at"),
+        CheckConstraint("role IN ('user', 'assistant', 'system')", name="ck_chat_messages_role"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     session_id = Column(UUID(as_uuid=True), ForeignKey("chat_sessions.id", ondelete="CASCADE"), nullable=False)
-    role = Column(SQLEnum(MessageRole), nullable=False)
+    role = Column(String(20), nullable=False)  # MessageRole value
     content = Column(Text, nullable=False)
     
     # Optional metadata
@@ -43,15 +48,21 @@ class ChatMessage(Base):
     code_blocks = Column(JSON, nullable=True)  # Extracted code blocks with language
     token_count = Column(Integer, nullable=True)
     
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    # clock_timestamp() (not now()) keeps messages inserted in one transaction ordered
+    created_at = Column(DateTime(timezone=True), server_default=func.clock_timestamp(), nullable=False)
     
     # Relationships
     session = relationship("ChatSession", back_populates="messages")
+    
+    @validates("role")
+    def validate_role(self, key, value):
+        return MessageRole(value).value
 
 
 class CodeGeneration(Base):
     """Track code generation tasks"""
     __tablename__ = "code_generations"
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
@@ -70,7 +81,7 @@ class CodeGeneration(Base):
     temperature = Column(String(10), nullable=True)
     tokens_used = Column(Integer, nullable=True)
     
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
     project = relationship("Project")
@@ -1,7 +1,6 @@
-from datetime import datetime
 import uuid
 
-from sqlalchemy import Column, String, ForeignKey, DateTime, Integer, Text
+from sqlalchemy import Column, String, ForeignKey, DateTime, Integer, Text, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -10,6 +9,11 @@ from app.db.session import Base
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Project list: filtered by owner, ordered by most recently updated
+        Index("ix_projects_owner_updated", "owner_id", "updated_at"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -31,8 +35,8 @@ class Project(Base):
     max_size_kb = Column(Integer, default=10240)     # Free: 10MB, Pro: 1GB
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     last_accessed_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
@@ -1,10 +1,9 @@
-from datetime import datetime
 import uuid
 import enum
 
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Integer, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Integer, Boolean, Index, CheckConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
 from app.db.session import Base
 
@@ -16,6 +15,11 @@ class FileType(str, enum.Enum):
 
 class ProjectFile(Base):
     __tablename__ = "project_files"
+    __table_args__ = (
+        Index("ix_project_files_project_parent", "project_id", "parent_id"),
+        CheckConstraint("type IN ('file', 'directory')", name="ck_project_files_type"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -26,7 +30,7 @@ class ProjectFile(Base):
     # File info
     name = Column(String(255), nullable=False)
     path = Column(String(1000), nullable=False)  # Full path from project root
-    type = Column(SQLEnum(FileType), default=FileType.FILE)
+    type = Column(String(20), default=FileType.FILE.value)  # FileType value
     
     # Content (for files)
     content = Column(Text, nullable=True)
@@ -42,8 +46,8 @@ class ProjectFile(Base):
     parent_id = Column(UUID(as_uuid=True), ForeignKey("project_files.id", ondelete="CASCADE"), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     project = relationship("Project", back_populates="files")
@@ -52,6 +56,10 @@ class ProjectFile(Base):
     def __repr__(self):
         return f"<ProjectFile {self.path}>"
     
+    @validates("type")
+    def validate_type(self, key, value):
+        return FileType(value).value
+    
     @property
     def is_directory(self) -> bool:
         """Check if this is a directory."""
@@ -1,7 +1,7 @@
 from datetime import datetime
 import uuid
 
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -10,6 +10,7 @@ from app.db.session import Base
 
 class Session(Base):
     __tablename__ = "sessions"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -18,7 +19,7 @@ class Session(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Token fields
-    refresh_token = Column(String(512), unique=True, nullable=False, index=True)
+    refresh_token = Column(String(512), unique=True, nullable=False, index=True)  # sha256 hex digest, never the raw token
     access_token_jti = Column(String(255), nullable=True)  # JWT ID for access token
     
     # Session metadata
@@ -26,9 +27,9 @@ class Session(Base):
     user_agent = Column(String(512), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     expires_at = Column(DateTime(timezone=True), nullable=False)
-    last_activity = Column(DateTime(timezone=True), default=datetime.utcnow)
+    last_activity = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     user = relationship("User", back_populates="sessions")
@@ -1,7 +1,6 @@
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Boolean, Integer, JSON, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Boolean, Integer, JSON, Index, CheckConstraint, text, func
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.orm import relationship, validates
 import uuid
 import enum
 
@@ -30,6 +29,15 @@ class PaymentStatus(str, enum.Enum):
 class Subscription(Base):
     """User subscription details"""
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('active', 'past_due', 'canceled', 'unpaid', 'trialing', 'incomplete', 'incomplete_expired')",
+            name="ck_subscriptions_status"
+        ),
+        # Expiry sweeps: status + period end
+        Index("ix_subs_status_period_end", "status", "current_period_end"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
@@ -40,7 +48,7 @@ class Subscription(Base):
     stripe_product_id = Column(String(255), nullable=False)
     
     # Subscription details
-    status = Column(SQLEnum(SubscriptionStatus), nullable=False)
+    status = Column(String(20), nullable=False)  # SubscriptionStatus value
     current_period_start = Column(DateTime(timezone=True), nullable=False)
     current_period_end = Column(DateTime(timezone=True), nullable=False)
     cancel_at = Column(DateTime(timezone=True), nullable=True)
@@ -48,16 +56,30 @@ class Subscription(Base):
     trial_end = Column(DateTime(timezone=True), nullable=True)
     
     # Metadata
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    stripe_event_created_at = Column(DateTime(timezone=True), nullable=True)  # `created` of the last applied webhook event
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="subscription")
     
+    @validates("status")
+    def validate_status(self, key, value):
+        return SubscriptionStatus(value).value
+    
 
 class Payment(Base):
     """Payment history"""
     __tablename__ = "payments"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'processing', 'succeeded', 'failed', 'canceled', 'refunded')",
+            name="ck_payments_status"
+        ),
+        # Payment history: user's payments newest first
+        Index("ix_payments_user_created", "user_id", "created_at"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -70,7 +92,7 @@ class Payment(Base):
     # Payment details
     amount = Column(Integer, nullable=False)  # Amount in cents
     currency = Column(String(3), default="usd", nullable=False)
-    status = Column(SQLEnum(PaymentStatus), nullable=False)
+    status = Column(String(20), nullable=False)  # PaymentStatus value
     description = Column(Text, nullable=True)
     
     # Invoice details
@@ -78,17 +100,26 @@ class Payment(Base):
     receipt_url = Column(String(500), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     paid_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     user = relationship("User", back_populates="payments")
     subscription = relationship("Subscription")
+    
+    @validates("status")
+    def validate_status(self, key, value):
+        return PaymentStatus(value).value
 
 
 class PriceProduct(Base):
     """Available price/product combinations"""
     __tablename__ = "price_products"
+    __table_args__ = (
+        # Price picker: active prices ordered by amount
+        Index("ix_price_products_active_amount", "amount", postgresql_where=text("active")),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
@@ -108,16 +139,17 @@ class PriceProduct(Base):
     
     # Features
     features = Column(JSON, nullable=False, default=list)
-    metadata = Column(JSON, nullable=True)
+    metadata_ = Column("metadata", JSON, nullable=True)  # `metadata` is reserved on declarative classes
     
     # Status
     active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 
 class WebhookEvent(Base):
     """Stripe webhook events for idempotency"""
     __tablename__ = "webhook_events"
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     stripe_event_id = Column(String(255), unique=True, nullable=False)
@@ -129,5 +161,5 @@ class WebhookEvent(Base):
     error = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     processed_at = Column(DateTime(timezone=True), nullable=True)
\ No newline at end of file
@@ -1,8 +1,6 @@
-from datetime import datetime
 from typing import Optional
-import uuid
 
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Enum as SQLEnum, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -22,12 +20,19 @@ class SubscriptionPlan(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Admin/analytics: active users by plan
+        Index("ix_users_active_plan", "subscription_plan", postgresql_where=text("is_active")),
+        # Monthly token reset sweep
+        Index("ix_users_tokens_reset_at", "tokens_reset_at"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     
     # Authentication fields
-    email = Column(String(255), unique=True, index=True, nullable=False)
+    email = Column(String(255), nullable=False)  # unique case-insensitively, see ix_users_email_lower
     username = Column(String(255), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=True)  # Nullable for OAuth users
     
@@ -55,8 +60,8 @@ class User(Base):
     tokens_reset_at = Column(DateTime(timezone=True), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     last_login_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
@@ -66,4 +71,8 @@ class User(Base):
     payments = relationship("Payment", back_populates="user")
     
     def __repr__(self):
-        return f"<User {self.email}>"
\ No newline at end of file
+        return f"<User {self.email}>"
+
+
+# Case-insensitive email uniqueness; serves lookups on lower(email)
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
\ No newline at end of file
@@ -1,7 +1,24 @@
+from app.schemas.base import BaseSchema
 from app.schemas.user import UserCreate, UserUpdate, User, UserInDB, UserLogin, Token, TokenPayload
 from app.schemas.project import ProjectCreate, ProjectUpdate, Project
+from app.schemas import auth, chat, project_file, subscription  # noqa: F401 - register all schemas
 
 __all__ = [
     "UserCreate", "UserUpdate", "User", "UserInDB", "UserLogin", "Token", "TokenPayload",
     "ProjectCreate", "ProjectUpdate", "Project",
-]
\ No newline at end of file
+    "warm_schema_cache",
+]
+
+
+def warm_schema_cache() -> None:
+    """
+    Finish building every schema up front so no request pays for it.
+    Completes any deferred (forward-referenced) models and generates each JSON schema once.
+    """
+    pending = [BaseSchema]
+    while pending:
+        schema = pending.pop()
+        pending.extend(schema.__subclasses__())
+        if not schema.__pydantic_complete__:
+            schema.model_rebuild()
+        schema.model_json_schema()
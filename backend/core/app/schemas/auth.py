@@ -1,53 +1,79 @@
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import EmailStr, Field, field_validator
 import re
 
+from app.schemas.base import BaseSchema
+from app.schemas.types import LoginEmail
 
-class UserSignUp(BaseModel):
+
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+
+def _check_password_strength(v: str) -> str:
+    """Validate password strength, raising ValueError with the first unmet rule"""
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters')
+    
+    # Single pass over the password, stopping once every class has been seen
+    has_upper = has_lower = has_digit = False
+    for c in v:
+        if 'A' <= c <= 'Z':
+            has_upper = True
+        elif 'a' <= c <= 'z':
+            has_lower = True
+        elif '0' <= c <= '9':
+            has_digit = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit:
+            return v
+    
+    if not has_upper:
+        raise ValueError('Password must contain at least one uppercase letter')
+    if not has_lower:
+        raise ValueError('Password must contain at least one lowercase letter')
+    raise ValueError('Password must contain at least one digit')
+
+
+class UserSignUp(BaseSchema):
     """Schema for user registration"""
     email: EmailStr
     username: str = Field(..., min_length=3, max_length=50)
     password: str = Field(..., min_length=8)
     full_name: Optional[str] = Field(None, max_length=255)
     
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def username_alphanumeric(cls, v):
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if _USERNAME_RE.match(v) is None:
             raise ValueError('Username must be alphanumeric with only _ and - allowed')
         return v
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def password_strength(cls, v):
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'[0-9]', v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+        return _check_password_strength(v)
 
 
-class UserSignIn(BaseModel):
+class UserSignIn(BaseSchema):
     """Schema for user login"""
-    email: EmailStr
+    email: LoginEmail
     password: str
 
 
-class Token(BaseModel):
+class Token(BaseSchema):
     """Schema for JWT tokens"""
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
 
 
-class TokenRefresh(BaseModel):
+class TokenRefresh(BaseSchema):
     """Schema for token refresh"""
     refresh_token: str
 
 
-class TokenPayload(BaseModel):
+class TokenPayload(BaseSchema):
     """Schema for JWT token payload"""
     sub: str
     exp: int
@@ -55,24 +81,17 @@ class TokenPayload(BaseModel):
     jti: Optional[str] = None
 
 
-class PasswordReset(BaseModel):
+class PasswordReset(BaseSchema):
     """Schema for password reset request"""
-    email: EmailStr
+    email: LoginEmail
 
 
-class PasswordResetConfirm(BaseModel):
+class PasswordResetConfirm(BaseSchema):
     """Schema for password reset confirmation"""
     token: str
     new_password: str = Field(..., min_length=8)
     
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def password_strength(cls, v):
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'[0-9]', v):
-            raise ValueError('Password must contain at least one digit')
-        return v
\ No newline at end of file
+        return _check_password_strength(v)
\ No newline at end of file
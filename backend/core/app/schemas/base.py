@@ -0,0 +1,9 @@
+"""
+Shared base class for API schemas
+"""
+from pydantic import BaseModel, ConfigDict
+
+
+class BaseSchema(BaseModel):
+    """Base schema: readable from ORM objects/rows, ignores unknown fields"""
+    model_config = ConfigDict(from_attributes=True, extra='ignore')
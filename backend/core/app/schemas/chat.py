@@ -2,21 +2,18 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import ConfigDict, Field, field_validator, UUID4
 
+from app.schemas.base import BaseSchema
 from app.models.chat import MessageRole
 
 
-class ChatMessageBase(BaseModel):
+class ChatMessageBase(BaseSchema):
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
     content: str = Field(..., min_length=1)
     role: MessageRole = MessageRole.USER
-    file_references: Optional[List[UUID]] = None
-    
-    @validator('content')
-    def content_not_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Message content cannot be empty')
-        return v.strip()
+    file_references: Optional[tuple[UUID4, ...]] = Field(None, max_length=64)
 
 
 class ChatMessageCreate(ChatMessageBase):
@@ -24,17 +21,14 @@ class ChatMessageCreate(ChatMessageBase):
 
 
 class ChatMessage(ChatMessageBase):
-    id: UUID
-    session_id: UUID
+    id: UUID4
+    session_id: UUID4
     code_blocks: Optional[List[Dict[str, Any]]] = None
     token_count: Optional[int] = None
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class ChatSessionBase(BaseModel):
+class ChatSessionBase(BaseSchema):
     title: Optional[str] = Field(None, max_length=255)
 
 
@@ -47,68 +41,64 @@ class ChatSessionUpdate(ChatSessionBase):
 
 
 class ChatSession(ChatSessionBase):
-    id: UUID
-    project_id: UUID
+    id: UUID4
+    project_id: UUID4
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class ChatSessionWithMessages(ChatSession):
     messages: List[ChatMessage] = []
 
 
-class ChatSessionList(BaseModel):
+class ChatSessionList(BaseSchema):
     sessions: List[ChatSession]
     total: int
 
 
-class CodeGenerationRequest(BaseModel):
+class CodeGenerationRequest(BaseSchema):
     prompt: str = Field(..., min_length=1)
     language: str = Field(..., max_length=50)
     target_file_path: Optional[str] = Field(None, max_length=1000)
     context: Optional[str] = None
     existing_code: Optional[str] = None
     
-    @validator('prompt')
+    @field_validator('prompt')
+    @classmethod
     def prompt_not_empty(cls, v):
-        if not v or not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError('Prompt cannot be empty')
-        return v.strip()
+        return stripped
 
 
-class CodeGenerationResponse(BaseModel):
-    id: UUID
+class CodeGenerationResponse(BaseSchema):
+    id: UUID4
     generated_code: str
     language: str
     target_file_path: Optional[str]
     tokens_used: Optional[int]
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class CodeExplanationRequest(BaseModel):
+class CodeExplanationRequest(BaseSchema):
     code: str = Field(..., min_length=1)
     language: str = Field(..., max_length=50)
 
 
-class CodeFixRequest(BaseModel):
+class CodeFixRequest(BaseSchema):
     code: str = Field(..., min_length=1)
     error_message: str = Field(..., min_length=1)
     language: str = Field(..., max_length=50)
 
 
-class CodeImprovementRequest(BaseModel):
+class CodeImprovementRequest(BaseSchema):
     code: str = Field(..., min_length=1)
     language: str = Field(..., max_length=50)
 
 
-class StreamingChatRequest(BaseModel):
+class StreamingChatRequest(BaseSchema):
     message: str = Field(..., min_length=1)
     session_id: UUID
-    file_references: Optional[List[UUID]] = None
+    file_references: Optional[tuple[UUID4, ...]] = Field(None, max_length=64)
     stream: bool = True
\ No newline at end of file
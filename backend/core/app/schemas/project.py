@@ -1,49 +1,38 @@
-from typing import Optional, List
+from typing import Optional, List, Literal
 from datetime import datetime
-from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import ConfigDict, Field, UUID4
 
+from app.schemas.base import BaseSchema
 
-class ProjectBase(BaseModel):
+
+ProjectLanguage = Literal['python', 'javascript', 'typescript', 'java', 'cpp', 'go', 'rust']
+
+
+class ProjectBase(BaseSchema):
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = Field(None, max_length=1000)
-    language: str = Field("python", max_length=50)
+    language: ProjectLanguage = "python"
     template: str = Field("blank", max_length=50)
-    
-    @validator('name')
-    def name_must_not_be_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Project name cannot be empty')
-        return v.strip()
-    
-    @validator('language')
-    def validate_language(cls, v):
-        allowed_languages = ['python', 'javascript', 'typescript', 'java', 'cpp', 'go', 'rust']
-        if v not in allowed_languages:
-            raise ValueError(f'Language must be one of {allowed_languages}')
-        return v
 
 
 class ProjectCreate(ProjectBase):
     pass
 
 
-class ProjectUpdate(BaseModel):
+class ProjectUpdate(BaseSchema):
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = Field(None, max_length=1000)
-    language: Optional[str] = Field(None, max_length=50)
-    
-    @validator('name')
-    def name_must_not_be_empty(cls, v):
-        if v is not None and (not v or not v.strip()):
-            raise ValueError('Project name cannot be empty')
-        return v.strip() if v else v
+    language: Optional[ProjectLanguage] = None
 
 
 class ProjectInDBBase(ProjectBase):
-    id: UUID
-    owner_id: UUID
+    id: UUID4
+    owner_id: UUID4
     max_files: int
     total_size_kb: int
     max_size_kb: int
@@ -51,9 +40,6 @@ class ProjectInDBBase(ProjectBase):
     updated_at: datetime
     last_accessed_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
-
 
 class Project(ProjectInDBBase):
     pass
@@ -63,7 +49,7 @@ class ProjectInDB(ProjectInDBBase):
     pass
 
 
-class ProjectList(BaseModel):
+class ProjectList(BaseSchema):
     """Response model for project list"""
     projects: List[Project]
     total: int
@@ -71,7 +57,7 @@ class ProjectList(BaseModel):
     page_size: int
     
 
-class ProjectStats(BaseModel):
+class ProjectStats(BaseSchema):
     """Project statistics"""
     total_files: int
     total_size_kb: int
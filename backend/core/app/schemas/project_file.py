@@ -2,32 +2,38 @@ from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import Field, field_validator, UUID4
 
+from app.schemas.base import BaseSchema
 from app.models.project_file import FileType
 
 
-class ProjectFileBase(BaseModel):
+_INVALID_FILE_CHARS = frozenset('/\\\0')
+
+
+class ProjectFileBase(BaseSchema):
     name: str = Field(..., min_length=1, max_length=255)
     path: str = Field(..., min_length=1, max_length=1000)
     type: FileType = FileType.FILE
     content: Optional[str] = None
     language: Optional[str] = Field(None, max_length=50)
     
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_name(cls, v):
-        if not v or not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError('File name cannot be empty')
         # Check for invalid characters
-        invalid_chars = ['/', '\\', '\0']
-        for char in invalid_chars:
-            if char in v:
-                raise ValueError(f'File name cannot contain {char}')
-        return v.strip()
+        if not _INVALID_FILE_CHARS.isdisjoint(stripped):
+            char = next(c for c in stripped if c in _INVALID_FILE_CHARS)
+            raise ValueError(f'File name cannot contain {char}')
+        return stripped
     
-    @validator('path')
+    @field_validator('path')
+    @classmethod
     def validate_path(cls, v):
-        if not v or not v.strip():
+        if not v.strip():
             raise ValueError('File path cannot be empty')
         # Normalize path separators
         v = v.replace('\\', '/')
@@ -41,21 +47,21 @@ class ProjectFileCreate(ProjectFileBase):
     parent_id: Optional[UUID] = None
 
 
-class ProjectFileUpdate(BaseModel):
+class ProjectFileUpdate(BaseSchema):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     content: Optional[str] = None
     language: Optional[str] = Field(None, max_length=50)
 
 
-class ProjectFileMove(BaseModel):
+class ProjectFileMove(BaseSchema):
     new_path: str = Field(..., min_length=1, max_length=1000)
     parent_id: Optional[UUID] = None
 
 
 class ProjectFileInDBBase(ProjectFileBase):
-    id: UUID
-    project_id: UUID
-    parent_id: Optional[UUID]
+    id: UUID4
+    project_id: UUID4
+    parent_id: Optional[UUID4]
     size_bytes: int
     is_binary: bool
     mime_type: Optional[str]
@@ -63,9 +69,6 @@ class ProjectFileInDBBase(ProjectFileBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ProjectFile(ProjectFileInDBBase):
     pass
@@ -75,7 +78,24 @@ class ProjectFileInDB(ProjectFileInDBBase):
     pass
 
 
-class ProjectFileTree(ProjectFile):
+class ProjectFileSummary(BaseSchema):
+    """File metadata without content, used by listings and the tree"""
+    id: UUID4
+    project_id: UUID4
+    parent_id: Optional[UUID4]
+    name: str
+    path: str
+    type: FileType
+    language: Optional[str]
+    size_bytes: int
+    is_binary: bool
+    mime_type: Optional[str]
+    encoding: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class ProjectFileTree(ProjectFileSummary):
     """File tree representation with children"""
     children: List['ProjectFileTree'] = []
 
@@ -83,9 +103,9 @@ class ProjectFileTree(ProjectFile):
 ProjectFileTree.model_rebuild()  # Enable forward reference
 
 
-class ProjectFileList(BaseModel):
+class ProjectFileList(BaseSchema):
     """Response model for file list"""
-    files: List[ProjectFile]
+    files: List[ProjectFileSummary]
     total: int
     directories: int
     total_size_bytes: int
\ No newline at end of file
@@ -1,20 +1,21 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import Field, field_validator, UUID4
 
+from app.schemas.base import BaseSchema
 from app.models.subscription import SubscriptionStatus, PaymentStatus
 
 
-class PriceProductBase(BaseModel):
+class PriceProductBase(BaseSchema):
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
     amount: int = Field(..., gt=0)
     currency: str = Field(default="usd", max_length=3)
-    interval: str = Field(..., regex="^(month|year)$")
+    interval: Literal["month", "year"]
     interval_count: int = Field(default=1, ge=1)
-    features: List[str] = []
+    features: tuple[str, ...] = Field(default_factory=tuple)
 
 
 class PriceProductCreate(PriceProductBase):
@@ -24,17 +25,14 @@ class PriceProductCreate(PriceProductBase):
 
 
 class PriceProduct(PriceProductBase):
-    id: UUID
+    id: UUID4
     stripe_price_id: str
     stripe_product_id: str
     active: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class SubscriptionBase(BaseModel):
+class SubscriptionBase(BaseSchema):
     status: SubscriptionStatus
     current_period_start: datetime
     current_period_end: datetime
@@ -49,7 +47,7 @@ class SubscriptionCreate(SubscriptionBase):
     stripe_product_id: str
 
 
-class SubscriptionUpdate(BaseModel):
+class SubscriptionUpdate(BaseSchema):
     status: Optional[SubscriptionStatus] = None
     current_period_start: Optional[datetime] = None
     current_period_end: Optional[datetime] = None
@@ -58,19 +56,16 @@ class SubscriptionUpdate(BaseModel):
 
 
 class Subscription(SubscriptionBase):
-    id: UUID
-    user_id: UUID
+    id: UUID4
+    user_id: UUID4
     stripe_subscription_id: str
     stripe_price_id: str
     stripe_product_id: str
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class PaymentBase(BaseModel):
+class PaymentBase(BaseSchema):
     amount: int = Field(..., gt=0)
     currency: str = Field(default="usd", max_length=3)
     status: PaymentStatus
@@ -84,67 +79,72 @@ class PaymentCreate(PaymentBase):
 
 
 class Payment(PaymentBase):
-    id: UUID
-    user_id: UUID
-    subscription_id: Optional[UUID]
+    id: UUID4
+    user_id: UUID4
+    subscription_id: Optional[UUID4]
     stripe_payment_intent_id: str
     stripe_invoice_id: Optional[str]
     invoice_pdf: Optional[str]
     receipt_url: Optional[str]
     created_at: datetime
     paid_at: Optional[datetime]
-    
-    class Config:
-        from_attributes = True
 
 
-class PaymentList(BaseModel):
+class PaymentList(BaseSchema):
     payments: List[Payment]
     total: int
     page: int
     page_size: int
 
 
-class CreateCheckoutSessionRequest(BaseModel):
+class CreateCheckoutSessionRequest(BaseSchema):
     price_id: str
     success_url: Optional[str] = None
     cancel_url: Optional[str] = None
 
 
-class CreateCheckoutSessionResponse(BaseModel):
+class CreateCheckoutSessionResponse(BaseSchema):
     checkout_url: str
     session_id: str
 
 
-class CreatePortalSessionRequest(BaseModel):
+class CreatePortalSessionRequest(BaseSchema):
     return_url: Optional[str] = None
 
 
-class CreatePortalSessionResponse(BaseModel):
+class CreatePortalSessionResponse(BaseSchema):
     portal_url: str
 
 
-class WebhookEventBase(BaseModel):
+class WebhookEventBase(BaseSchema):
     stripe_event_id: str
     event_type: str
     data: Dict[str, Any]
 
 
 class WebhookEvent(WebhookEventBase):
-    id: UUID
+    id: UUID4
     processed: bool
     error: Optional[str]
     created_at: datetime
     processed_at: Optional[datetime]
-    
-    class Config:
-        from_attributes = True
 
 
-class SubscriptionInfo(BaseModel):
+class UsageStats(BaseSchema):
+    """Current usage against plan limits"""
+    projects: int
+    max_projects: int  # -1 means unlimited
+    tokens_used: int
+    tokens_limit: int
+    storage_used_mb: float
+    storage_limit_mb: int
+    resets_at: Optional[datetime] = None  # next token usage reset
+
+
+class SubscriptionInfo(BaseSchema):
     """Combined subscription info for frontend"""
     has_subscription: bool
     subscription: Optional[Subscription] = None
     current_plan: str  # "free" or "pro"
     can_upgrade: bool
-    usage: Dict[str, Any]  # Current usage stats
\ No newline at end of file
+    usage: UsageStats
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""
+Shared annotated field types for schemas
+"""
+import re
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+
+_LOGIN_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+def _validate_login_email(v: str) -> str:
+    if _LOGIN_EMAIL_RE.match(v) is None:
+        raise ValueError('Invalid email address')
+    return v
+
+
+# Lightweight email check for paths that only look the address up (login,
+# reset requests). Sign-up keeps EmailStr for full validation.
+LoginEmail = Annotated[str, AfterValidator(_validate_login_email)]
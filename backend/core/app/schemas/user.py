@@ -1,25 +1,32 @@
 from datetime import datetime
 from typing import Optional
-from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import EmailStr, field_validator, UUID4
 import re
 
+from app.schemas.base import BaseSchema
+from app.schemas.types import LoginEmail
+
+
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9_-]{3,20}$")
+_LETTER_RE = re.compile(r"[a-zA-Z]")
+_DIGIT_RE = re.compile(r"\d")
+
 
 # Token schemas
-class Token(BaseModel):
+class Token(BaseSchema):
     access_token: str
     refresh_token: Optional[str] = None
     token_type: str = "bearer"
 
 
-class TokenPayload(BaseModel):
+class TokenPayload(BaseSchema):
     sub: str  # User ID
     exp: Optional[datetime] = None
 
 
 # User schemas
-class UserBase(BaseModel):
+class UserBase(BaseSchema):
     email: EmailStr
     username: str
     full_name: Optional[str] = None
@@ -27,7 +34,7 @@ class UserBase(BaseModel):
     @field_validator("username")
     @classmethod
     def validate_username(cls, v):
-        if not re.match(r"^[a-zA-Z0-9_-]{3,20}$", v):
+        if _USERNAME_RE.match(v) is None:
             raise ValueError("Username must be 3-20 characters long and contain only letters, numbers, underscores, and hyphens")
         return v
 
@@ -40,14 +47,14 @@ class UserCreate(UserBase):
     def validate_password(cls, v):
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[a-zA-Z]", v):
+        if _LETTER_RE.search(v) is None:
             raise ValueError("Password must contain at least one letter")
-        if not re.search(r"\d", v):
+        if _DIGIT_RE.search(v) is None:
             raise ValueError("Password must contain at least one digit")
         return v
 
 
-class UserUpdate(BaseModel):
+class UserUpdate(BaseSchema):
     full_name: Optional[str] = None
     email: Optional[EmailStr] = None
     username: Optional[str] = None
@@ -55,7 +62,7 @@ class UserUpdate(BaseModel):
 
 
 class UserInDBBase(UserBase):
-    id: UUID
+    id: UUID4
     is_active: bool
     is_verified: bool
     role: str
@@ -64,9 +71,6 @@ class UserInDBBase(UserBase):
     tokens_limit: int
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class User(UserInDBBase):
@@ -77,6 +81,6 @@ class UserInDB(UserInDBBase):
     hashed_password: Optional[str]
 
 
-class UserLogin(BaseModel):
-    email: EmailStr
+class UserLogin(BaseSchema):
+    email: LoginEmail
     password: str
\ No newline at end of file
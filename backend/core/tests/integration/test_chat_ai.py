@@ -1,8 +1,11 @@
 import pytest
-import json
-from unittest.mock import AsyncMock, patch
+import re
 
-from app.models.chat import ChatSession, ChatMessage
+from app.models.chat import ChatMessage
+from tests.utils import response_json
+
+# Payloads of SSE "data:" lines, matched on the raw response bytes
+SSE_DATA_RE = re.compile(rb"(?m)^data: (.+)$")
 
 
 @pytest.mark.asyncio
@@ -22,20 +25,15 @@ class TestChatAPI:
         )
         
         assert response.status_code == 201
-        data = response.json()
+        data = response_json(response)
         assert data["title"] == session_data["title"]
         assert data["project_id"] == str(test_project.id)
         assert "id" in data
     
-    async def test_list_chat_sessions(self, client, auth_headers, test_project, db_session):
+    async def test_list_chat_sessions(self, client, auth_headers, test_project, make_chat_session):
         """Test listing chat sessions."""
         # Create a test session
-        session = ChatSession(
-            project_id=test_project.id,
-            title="Test Session",
-        )
-        db_session.add(session)
-        await db_session.commit()
+        session = await make_chat_session(test_project.id)
         
         response = await client.get(
             f"/api/v1/projects/{test_project.id}/chat/sessions",
@@ -43,21 +41,15 @@ class TestChatAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert "sessions" in data
         assert "total" in data
         assert data["total"] >= 1
     
-    async def test_get_chat_session(self, client, auth_headers, test_project, db_session):
+    async def test_get_chat_session(self, client, auth_headers, test_project, db_session, make_chat_session):
         """Test getting a chat session with messages."""
         # Create session and messages
-        session = ChatSession(
-            project_id=test_project.id,
-            title="Test Session",
-        )
-        db_session.add(session)
-        await db_session.commit()
-        await db_session.refresh(session)
+        session = await make_chat_session(test_project.id)
         
         message = ChatMessage(
             session_id=session.id,
@@ -73,22 +65,50 @@ class TestChatAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert data["id"] == str(session.id)
         assert "messages" in data
         assert len(data["messages"]) == 1
         assert data["messages"][0]["content"] == "Hello, AI!"
     
-    async def test_stream_chat_response(self, client, auth_headers, test_project, db_session, mock_anthropic_client):
+    async def test_stream_chat_session_messages(self, client, auth_headers, test_project, db_session, make_chat_session):
+        """Test streaming a session's messages as one JSON document."""
+        session = await make_chat_session(test_project.id)
+        
+        # One flush per message so each row gets its own created_at
+        contents = ["first", "second", "third"]
+        for role, content in zip(["user", "assistant", "user"], contents):
+            db_session.add(ChatMessage(session_id=session.id, role=role, content=content))
+            await db_session.flush()
+        await db_session.commit()
+        
+        response = await client.get(
+            f"/api/v1/projects/{test_project.id}/chat/sessions/{session.id}/messages/stream",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response_json(response)
+        assert set(data) == {"session_id", "messages"}
+        assert data["session_id"] == str(session.id)
+        assert [message["content"] for message in data["messages"]] == contents
+        assert all(message["session_id"] == str(session.id) for message in data["messages"])
+    
+    async def test_stream_chat_session_messages_unknown_session(self, client, auth_headers, test_project):
+        """Test streaming messages of a session that does not exist."""
+        response = await client.get(
+            f"/api/v1/projects/{test_project.id}/chat/sessions/00000000-0000-0000-0000-000000000000/messages/stream",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 404
+        assert response_json(response)["detail"] == "Chat session not found"
+    
+    async def test_stream_chat_response(self, client, auth_headers, test_project, make_chat_session, mock_anthropic_client):
         """Test streaming chat response."""
         # Create a session
-        session = ChatSession(
-            project_id=test_project.id,
-            title="Test Session",
-        )
-        db_session.add(session)
-        await db_session.commit()
-        await db_session.refresh(session)
+        session = await make_chat_session(test_project.id)
         
         request_data = {
             "message": "Write a hello world function",
@@ -106,13 +126,10 @@ class TestChatAPI:
         assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
         
         # Parse SSE response
-        events = []
-        for line in response.text.split("\n"):
-            if line.startswith("data: "):
-                events.append(line[6:])
+        events = SSE_DATA_RE.findall(response.content)
         
         assert len(events) > 0
-        assert "Hello from Claude!" in "".join(events)
+        assert b"Hello from Claude!" in b"".join(events)
 
 
 @pytest.mark.asyncio
@@ -133,7 +150,7 @@ class TestCodeGeneration:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert "code" in data
         assert "explanation" in data
         assert data["code"] == "Generated code here"
@@ -152,7 +169,7 @@ class TestCodeGeneration:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert "explanation" in data
         assert data["explanation"] == "Generated code here"
     
@@ -171,7 +188,7 @@ class TestCodeGeneration:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert "fixed_code" in data
         assert "explanation" in data
         assert data["fixed_code"] == "Generated code here"
@@ -190,7 +207,7 @@ class TestCodeGeneration:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert "improved_code" in data
         assert "suggestions" in data
         assert data["improved_code"] == "Generated code here"
@@ -200,16 +217,10 @@ class TestCodeGeneration:
 class TestChatWithFileContext:
     """Test chat with file context."""
     
-    async def test_chat_with_file_references(self, client, auth_headers, test_project, test_file, db_session, mock_anthropic_client):
+    async def test_chat_with_file_references(self, client, auth_headers, test_project, test_file, make_chat_session, mock_anthropic_client):
         """Test chat with file references."""
         # Create a session
-        session = ChatSession(
-            project_id=test_project.id,
-            title="Test Session",
-        )
-        db_session.add(session)
-        await db_session.commit()
-        await db_session.refresh(session)
+        session = await make_chat_session(test_project.id)
         
         request_data = {
             "message": "Explain the code in test.py",
@@ -219,9 +230,9 @@ class TestChatWithFileContext:
         }
         
         # Mock the non-streaming response
-        mock_anthropic_client.messages.create.return_value = AsyncMock(
-            content=[AsyncMock(text="This file contains a simple print statement.")]
-        )
+        mock_anthropic_client.create_message.return_value = {
+            "content": [{"type": "text", "text": "This file contains a simple print statement."}],
+        }
         
         response = await client.post(
             f"/api/v1/projects/{test_project.id}/chat/stream",
@@ -230,7 +241,7 @@ class TestChatWithFileContext:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert "message_id" in data
         assert "content" in data
         assert "This file contains" in data["content"]
\ No newline at end of file
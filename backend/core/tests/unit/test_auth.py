@@ -1,7 +1,9 @@
 import pytest
 from datetime import datetime, timedelta
 from jose import jwt
+from passlib.context import CryptContext
 
+from app.core import security
 from app.core.security import (
     create_access_token,
     create_refresh_token,
@@ -9,24 +11,43 @@ from app.core.security import (
     get_password_hash,
 )
 from app.core.config import settings
+from tests.utils import response_json
 
 
 class TestSecurity:
     """Test security functions."""
     
-    def test_password_hashing(self):
-        """Test password hashing and verification."""
+    def test_password_hashing(self, monkeypatch):
+        """Test password hashing and verification with real bcrypt."""
+        # conftest swaps in a fast digest for the session; exercise bcrypt here
+        monkeypatch.setattr(security, "pwd_context", CryptContext(schemes=["bcrypt"], bcrypt__rounds=4))
         password = "TestPassword123!"
         hashed = get_password_hash(password)
         
+        assert hashed.startswith("$2b$04$")
         assert hashed != password
         assert verify_password(password, hashed) is True
         assert verify_password("WrongPassword", hashed) is False
     
-    def test_create_access_token(self):
-        """Test access token creation."""
-        data = {"sub": "test@example.com"}
-        token = create_access_token(data)
+    @pytest.mark.parametrize(
+        "create_token,token_type,lifetime",
+        [
+            (
+                lambda subject: create_access_token(subject)[0],
+                "access",
+                timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+            ),
+            (
+                create_refresh_token,
+                "refresh",
+                timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            ),
+        ],
+        ids=["access", "refresh"],
+    )
+    def test_create_token(self, create_token, token_type, lifetime):
+        """Test token claims and expiration time."""
+        token = create_token("test@example.com")
         
         decoded = jwt.decode(
             token,
@@ -35,49 +56,11 @@ class TestSecurity:
         )
         
         assert decoded["sub"] == "test@example.com"
-        assert "exp" in decoded
-        assert decoded["type"] == "access"
-    
-    def test_create_refresh_token(self):
-        """Test refresh token creation."""
-        data = {"sub": "test@example.com"}
-        token = create_refresh_token(data)
-        
-        decoded = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
-        
-        assert decoded["sub"] == "test@example.com"
-        assert "exp" in decoded
-        assert decoded["type"] == "refresh"
-    
-    def test_token_expiration(self):
-        """Test token expiration times."""
-        data = {"sub": "test@example.com"}
+        assert decoded["type"] == token_type
         
-        # Test access token expiration
-        access_token = create_access_token(data)
-        decoded = jwt.decode(
-            access_token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
-        exp_time = datetime.fromtimestamp(decoded["exp"])
-        expected_exp = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        exp_time = datetime.utcfromtimestamp(decoded["exp"])
+        expected_exp = datetime.utcnow() + lifetime
         assert abs((exp_time - expected_exp).total_seconds()) < 5  # Allow 5 seconds difference
-        
-        # Test refresh token expiration
-        refresh_token = create_refresh_token(data)
-        decoded = jwt.decode(
-            refresh_token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
-        exp_time = datetime.fromtimestamp(decoded["exp"])
-        expected_exp = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-        assert abs((exp_time - expected_exp).total_seconds()) < 5
 
 
 @pytest.mark.asyncio
@@ -92,7 +75,7 @@ class TestAuthEndpoints:
         )
         
         assert response.status_code == 201
-        data = response.json()
+        data = response_json(response)
         assert "access_token" in data
         assert "refresh_token" in data
         assert data["token_type"] == "bearer"
@@ -109,7 +92,7 @@ class TestAuthEndpoints:
         )
         
         assert response.status_code == 409
-        assert "already registered" in response.json()["detail"]
+        assert "already registered" in response_json(response)["detail"]
     
     async def test_signin(self, client, test_user, test_user_data):
         """Test user signin."""
@@ -122,7 +105,7 @@ class TestAuthEndpoints:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert "access_token" in data
         assert "refresh_token" in data
         assert data["token_type"] == "bearer"
@@ -138,7 +121,7 @@ class TestAuthEndpoints:
         )
         
         assert response.status_code == 401
-        assert "Invalid credentials" in response.json()["detail"]
+        assert "Invalid credentials" in response_json(response)["detail"]
     
     async def test_signin_nonexistent_user(self, client):
         """Test signin with nonexistent user."""
@@ -151,7 +134,7 @@ class TestAuthEndpoints:
         )
         
         assert response.status_code == 401
-        assert "Invalid credentials" in response.json()["detail"]
+        assert "Invalid credentials" in response_json(response)["detail"]
     
     async def test_get_current_user(self, client, test_user, auth_headers):
         """Test getting current user."""
@@ -161,7 +144,7 @@ class TestAuthEndpoints:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert data["email"] == test_user.email
         assert data["full_name"] == test_user.full_name
         assert data["id"] == str(test_user.id)
@@ -182,7 +165,7 @@ class TestAuthEndpoints:
             }
         )
         
-        refresh_token = signin_response.json()["refresh_token"]
+        refresh_token = response_json(signin_response)["refresh_token"]
         
         # Use refresh token
         response = await client.post(
@@ -191,7 +174,7 @@ class TestAuthEndpoints:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert "access_token" in data
         assert "refresh_token" in data
         assert data["token_type"] == "bearer"
@@ -207,7 +190,7 @@ class TestAuthEndpoints:
             }
         )
         
-        refresh_token = signin_response.json()["refresh_token"]
+        refresh_token = response_json(signin_response)["refresh_token"]
         
         # Logout
         response = await client.post(
@@ -217,4 +200,4 @@ class TestAuthEndpoints:
         )
         
         assert response.status_code == 200
-        assert response.json()["message"] == "Successfully logged out"
\ No newline at end of file
+        assert response_json(response)["message"] == "Successfully logged out"
\ No newline at end of file
@@ -1,7 +1,11 @@
 import pytest
 import base64
+from sqlalchemy import insert
 
-from app.models.file import ProjectFile
+from app.core.config import settings
+from app.models.project import Project
+from app.models.project_file import ProjectFile
+from tests.utils import response_json
 
 
 @pytest.mark.asyncio
@@ -24,7 +28,7 @@ class TestFileAPI:
         )
         
         assert response.status_code == 201
-        data = response.json()
+        data = response_json(response)
         assert data["name"] == file_data["name"]
         assert data["path"] == file_data["path"]
         assert data["type"] == file_data["type"]
@@ -47,7 +51,7 @@ class TestFileAPI:
         )
         
         assert response.status_code == 201
-        data = response.json()
+        data = response_json(response)
         assert data["name"] == dir_data["name"]
         assert data["type"] == "directory"
         assert data["size_bytes"] == 0
@@ -60,7 +64,7 @@ class TestFileAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert "files" in data
         assert "total" in data
         assert data["total"] >= 1
@@ -76,12 +80,12 @@ class TestFileAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert data["id"] == str(test_file.id)
         assert data["name"] == test_file.name
         assert data["content"] == test_file.content
     
-    async def test_update_file(self, client, auth_headers, test_project, test_file):
+    async def test_update_file(self, client, auth_headers, test_project, test_file, db_session):
         """Test updating a file."""
         update_data = {
             "content": "# Updated content\nprint('Updated')",
@@ -94,9 +98,14 @@ class TestFileAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert data["content"] == update_data["content"]
         assert data["size_bytes"] == len(update_data["content"])
+        
+        # Verify the stored row directly
+        stored = await db_session.get(ProjectFile, test_file.id, populate_existing=True)
+        assert stored.content == update_data["content"]
+        assert stored.size_bytes == len(update_data["content"])
     
     async def test_move_file(self, client, auth_headers, test_project, test_file, db_session):
         """Test moving a file."""
@@ -108,8 +117,7 @@ class TestFileAPI:
             type="directory",
         )
         db_session.add(src_dir)
-        await db_session.commit()
-        await db_session.refresh(src_dir)
+        await db_session.flush()
         
         move_data = {
             "new_path": "/src/test.py",
@@ -123,11 +131,11 @@ class TestFileAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert data["path"] == move_data["new_path"]
         assert data["parent_id"] == move_data["parent_id"]
     
-    async def test_delete_file(self, client, auth_headers, test_project, test_file):
+    async def test_delete_file(self, client, auth_headers, test_project, test_file, db_session):
         """Test deleting a file."""
         response = await client.delete(
             f"/api/v1/projects/{test_project.id}/files/{test_file.id}",
@@ -135,14 +143,10 @@ class TestFileAPI:
         )
         
         assert response.status_code == 200
-        assert "successfully deleted" in response.json()["message"]
+        assert "successfully deleted" in response_json(response)["message"]
         
         # Verify file is deleted
-        get_response = await client.get(
-            f"/api/v1/projects/{test_project.id}/files/{test_file.id}",
-            headers=auth_headers
-        )
-        assert get_response.status_code == 404
+        assert await db_session.get(ProjectFile, test_file.id, populate_existing=True) is None
     
     async def test_file_tree(self, client, auth_headers, test_project, db_session):
         """Test getting file tree structure."""
@@ -154,8 +158,7 @@ class TestFileAPI:
             type="directory",
         )
         db_session.add(src_dir)
-        await db_session.commit()
-        await db_session.refresh(src_dir)
+        await db_session.flush()
         
         # Create file in directory
         src_file = ProjectFile(
@@ -175,7 +178,7 @@ class TestFileAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response_json(response)
         assert isinstance(data, list)
         
         # Find src directory in tree
@@ -183,27 +186,64 @@ class TestFileAPI:
         assert src_node["type"] == "directory"
         assert len(src_node["children"]) == 1
         assert src_node["children"][0]["name"] == "app.py"
+    
+    async def test_file_tree_orphans_at_root(self, client, auth_headers, test_user, test_project, db_session):
+        """Test entries whose parent is outside the project are listed at the root."""
+        other_project = Project(name="Other Project", owner_id=test_user.id)
+        db_session.add(other_project)
+        await db_session.flush()
+        
+        foreign_dir = ProjectFile(
+            project_id=other_project.id,
+            name="lib",
+            path="/lib",
+            type="directory",
+        )
+        db_session.add(foreign_dir)
+        await db_session.flush()
+        
+        orphan = ProjectFile(
+            project_id=test_project.id,
+            parent_id=foreign_dir.id,
+            name="orphan.py",
+            path="/lib/orphan.py",
+            type="file",
+            content="# Orphan",
+        )
+        db_session.add(orphan)
+        await db_session.commit()
+        
+        response = await client.get(
+            f"/api/v1/projects/{test_project.id}/files/tree",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        assert [node["name"] for node in response_json(response)] == ["orphan.py"]
 
 
 @pytest.mark.asyncio
 class TestFileLimits:
     """Test file limits and quotas."""
     
-    async def test_file_count_limit(self, client, auth_headers, test_project):
+    async def test_file_count_limit(self, client, auth_headers, test_project, db_session):
         """Test file count limits per project."""
-        # Create files up to limit (20 for free tier)
-        for i in range(20):
-            response = await client.post(
-                f"/api/v1/projects/{test_project.id}/files",
-                json={
+        # Seed files up to limit (20 for free tier) in one statement
+        await db_session.execute(
+            insert(ProjectFile),
+            [
+                {
+                    "project_id": test_project.id,
                     "name": f"file{i}.txt",
                     "path": f"/file{i}.txt",
                     "type": "file",
                     "content": "test",
-                },
-                headers=auth_headers
-            )
-            assert response.status_code == 201
+                    "size_bytes": 4,
+                }
+                for i in range(20)
+            ],
+        )
+        await db_session.commit()
         
         # Try to create one more (should fail)
         response = await client.post(
@@ -217,12 +257,13 @@ class TestFileLimits:
             headers=auth_headers
         )
         assert response.status_code == 403
-        assert "file limit" in response.json()["detail"].lower()
+        assert "file limit" in response_json(response)["detail"].lower()
     
-    async def test_file_size_limit(self, client, auth_headers, test_project):
+    async def test_file_size_limit(self, client, auth_headers, test_project, monkeypatch):
         """Test individual file size limit."""
-        # Try to create a file that's too large (>5MB)
-        large_content = "x" * (5 * 1024 * 1024 + 1)  # 5MB + 1 byte
+        # Shrink the limit so the same check runs against a 1KB body instead of 5MB
+        monkeypatch.setattr(settings, "MAX_FILE_SIZE_BYTES", 1024)
+        large_content = "x" * (1024 + 1)
         
         response = await client.post(
             f"/api/v1/projects/{test_project.id}/files",
@@ -235,27 +276,48 @@ class TestFileLimits:
             headers=auth_headers
         )
         assert response.status_code == 413
-        assert "too large" in response.json()["detail"].lower()
+        assert "too large" in response_json(response)["detail"].lower()
+    
+    async def test_file_size_limit_checked_after_access(self, client, auth_headers, monkeypatch):
+        """Test an oversized file for an unknown project is a 404, not a 413."""
+        monkeypatch.setattr(settings, "MAX_FILE_SIZE_BYTES", 1024)
+        
+        response = await client.post(
+            "/api/v1/projects/00000000-0000-0000-0000-000000000000/files",
+            json={
+                "name": "large.txt",
+                "path": "/large.txt",
+                "type": "file",
+                "content": "x" * (1024 + 1),
+            },
+            headers=auth_headers
+        )
+        assert response.status_code == 404
     
-    async def test_project_size_limit(self, client, auth_headers, test_project):
+    async def test_project_size_limit(self, client, auth_headers, test_project, db_session):
         """Test total project size limit."""
-        # Create files that approach the 10MB limit for free tier
-        file_size = 2 * 1024 * 1024  # 2MB per file
+        # Use a 10KB project cap so a few 4KB files exercise the same path as the 10MB tier
+        file_size = 4 * 1024  # 4KB per file
         content = "x" * file_size
+        test_project.max_size_kb = 10
         
-        # Create 4 files (8MB total)
-        for i in range(4):
-            response = await client.post(
-                f"/api/v1/projects/{test_project.id}/files",
-                json={
+        # Bulk insert 2 files (8KB total) and account for them on the project
+        await db_session.execute(
+            insert(ProjectFile),
+            [
+                {
+                    "project_id": test_project.id,
                     "name": f"large{i}.txt",
                     "path": f"/large{i}.txt",
                     "type": "file",
                     "content": content,
-                },
-                headers=auth_headers
-            )
-            assert response.status_code == 201
+                    "size_bytes": file_size,
+                }
+                for i in range(2)
+            ],
+        )
+        test_project.total_size_kb = 2 * file_size // 1024
+        await db_session.commit()
         
         # Try to create one more that would exceed limit
         response = await client.post(
@@ -269,4 +331,4 @@ class TestFileLimits:
             headers=auth_headers
         )
         assert response.status_code == 403
-        assert "storage limit" in response.json()["detail"].lower()
\ No newline at end of file
+        assert "size limit" in response_json(response)["detail"].lower()
\ No newline at end of file
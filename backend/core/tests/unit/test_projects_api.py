@@ -0,0 +1,220 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert
+
+from app.models.project import Project
+from tests.utils import response_json
+
+
+@pytest.mark.asyncio
+class TestProjectAPI:
+    """Test project endpoints."""
+    
+    async def test_create_project(self, client, auth_headers):
+        """Test project creation."""
+        project_data = {
+            "name": "My Test Project",
+            "description": "A test project",
+            "language": "python",
+            "template": "blank",
+        }
+        
+        response = await client.post(
+            "/api/v1/projects/",
+            json=project_data,
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 201
+        data = response_json(response)
+        assert data["name"] == project_data["name"]
+        assert data["description"] == project_data["description"]
+        assert data["language"] == project_data["language"]
+        assert data["template"] == project_data["template"]
+        assert "id" in data
+        assert "created_at" in data
+    
+    async def test_list_projects(self, client, auth_headers, test_project):
+        """Test listing projects."""
+        response = await client.get(
+            "/api/v1/projects/",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response_json(response)
+        assert "projects" in data
+        assert "total" in data
+        assert data["total"] >= 1
+        
+        project_ids = [p["id"] for p in data["projects"]]
+        assert str(test_project.id) in project_ids
+    
+    async def test_list_projects_is_constant_query_count(
+        self, client, auth_headers, db_session, test_user, query_counter
+    ):
+        """Test listing runs the same number of queries however many projects exist."""
+        await db_session.execute(
+            insert(Project),
+            [{"owner_id": test_user.id, "name": f"P{i}"} for i in range(50)],
+        )
+        await db_session.flush()
+        
+        with query_counter() as statements:
+            response = await client.get(
+                "/api/v1/projects/",
+                params={"page_size": 100},
+                headers=auth_headers
+            )
+        
+        assert response.status_code == 200
+        assert len(response_json(response)["projects"]) == 50
+        # Current user, total count, page of projects, last-accessed bulk update
+        assert len(statements) <= 4, statements
+    
+    async def test_project_lifecycle(self, client, auth_headers, test_project):
+        """Test getting, updating and deleting a project, then getting it again."""
+        url = f"/api/v1/projects/{test_project.id}"
+        
+        response = await client.get(url, headers=auth_headers)
+        assert response.status_code == 200, "get existing project"
+        data = response_json(response)
+        assert data["id"] == str(test_project.id)
+        assert data["name"] == test_project.name
+        
+        update_data = {
+            "name": "Updated Project Name",
+            "description": "Updated description",
+        }
+        response = await client.put(url, json=update_data, headers=auth_headers)
+        assert response.status_code == 200, "update project"
+        data = response_json(response)
+        assert data["name"] == update_data["name"]
+        assert data["description"] == update_data["description"]
+        
+        response = await client.delete(url, headers=auth_headers)
+        assert response.status_code == 200, "delete project"
+        assert "successfully deleted" in response_json(response)["message"]
+        
+        response = await client.get(url, headers=auth_headers)
+        assert response.status_code == 404, "deleted project is gone"
+        assert "Project not found" in response_json(response)["detail"]
+    
+    async def test_project_stats(self, client, auth_headers, test_project, test_file, query_counter):
+        """Test getting project statistics."""
+        with query_counter() as statements:
+            response = await client.get(
+                f"/api/v1/projects/{test_project.id}/stats",
+                headers=auth_headers
+            )
+        
+        assert response.status_code == 200
+        # Current user, project, file aggregates, language breakdown
+        assert len(statements) <= 4, statements
+        data = response_json(response)
+        assert data["total_files"] == 1
+        assert data["total_size_kb"] > 0
+        assert "language_breakdown" in data
+        assert "python" in data["language_breakdown"]
+
+
+MISSING_PROJECT_PATH = "/api/v1/projects/00000000-0000-0000-0000-000000000000"
+
+
+@pytest.mark.asyncio
+class TestProjectErrors:
+    """Test error responses of project endpoints."""
+    
+    @pytest.mark.parametrize(
+        "method,path,authenticated,body,status_code,detail_sub",
+        [
+            ("POST", "/api/v1/projects/", False, {"name": "Test"}, 401, "Not authenticated"),
+            ("GET", MISSING_PROJECT_PATH, True, None, 404, "Project not found"),
+            ("POST", "/api/v1/projects/", True, {"name": "   "}, 422, None),
+            ("POST", "/api/v1/projects/", True, {"name": "Test", "language": "cobol"}, 422, None),
+        ],
+        ids=["unauthorized", "not-found", "blank-name", "unknown-language"],
+    )
+    async def test_error_response(
+        self, client, auth_headers, method, path, authenticated, body, status_code, detail_sub
+    ):
+        """Test that bad requests get the expected status and detail."""
+        headers = auth_headers if authenticated else None
+        
+        response = await client.request(method, path, json=body, headers=headers)
+        
+        assert response.status_code == status_code
+        if detail_sub is not None:
+            assert detail_sub in response_json(response)["detail"]
+
+
+@pytest.mark.asyncio
+class TestProjectLimits:
+    """Test project limits and quotas."""
+    
+    async def test_free_tier_project_limit(self, client, auth_headers, db_session, test_user):
+        """Test free tier can only create 1 project."""
+        # Create first project (should succeed)
+        response = await client.post(
+            "/api/v1/projects/",
+            json={"name": "Project 1"},
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+        
+        # Try to create second project (should fail)
+        response = await client.post(
+            "/api/v1/projects/",
+            json={"name": "Project 2"},
+            headers=auth_headers
+        )
+        assert response.status_code == 403
+        assert "project limit" in response_json(response)["detail"].lower()
+    
+    async def test_pro_tier_project_limit(self, client, auth_headers, db_session, test_user):
+        """Test pro tier has no project limit."""
+        # Mock user as having pro subscription
+        from app.models.subscription import Subscription, SubscriptionStatus
+        from app.models.user import SubscriptionPlan
+        
+        now = datetime.now(timezone.utc)
+        await db_session.execute(
+            insert(Subscription).values(
+                user_id=test_user.id,
+                stripe_subscription_id="sub_test123",
+                stripe_price_id="price_test123",
+                stripe_product_id="prod_test123",
+                status=SubscriptionStatus.ACTIVE.value,
+                current_period_start=now,
+                current_period_end=now + timedelta(days=30),
+            )
+        )
+        test_user.subscription_plan = SubscriptionPlan.PRO
+        await db_session.flush()
+        
+        # Create one project through the API
+        response = await client.post(
+            "/api/v1/projects/",
+            json={"name": "Project 1"},
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+        
+        # Seed more projects past the free limit in one statement
+        await db_session.execute(
+            insert(Project),
+            [
+                {"owner_id": test_user.id, "name": f"Project {i}", "language": "python"}
+                for i in range(2, 6)
+            ],
+        )
+        await db_session.commit()
+        
+        # Pro users can still create another
+        response = await client.post(
+            "/api/v1/projects/",
+            json={"name": "Project 6"},
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+
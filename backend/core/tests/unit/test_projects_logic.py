@@ -0,0 +1,51 @@
+import pytest
+from uuid import UUID
+from fastapi import HTTPException
+from sqlalchemy import select, func
+
+from app.api import deps
+from app.api.v1.endpoints.projects import read_project
+from app.models.project import Project
+
+
+@pytest.mark.asyncio
+class TestProjectLogic:
+    """Test project handlers called directly, without the HTTP stack."""
+    
+    async def test_get_project_not_found(self, db_session, test_user):
+        """Test getting non-existent project."""
+        fake_id = UUID("00000000-0000-0000-0000-000000000000")
+        
+        # Skip the response cache wrapper; only the handler logic is under test
+        with pytest.raises(HTTPException) as exc_info:
+            await read_project.__wrapped__(db=db_session, project_id=fake_id, current_user=test_user)
+        
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Project not found"
+    
+    async def test_invalid_token_unauthorized(self, db_session):
+        """Test that requests without a valid token are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            await deps.get_current_user(db=db_session, token="not-a-jwt")
+        
+        assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+class TestTransactionIsolation:
+    """Guard the rollback-per-test db_session fixture."""
+    
+    async def test_commit_stays_inside_test_transaction(self, db_engine, db_session, test_user):
+        """Committed rows must not be visible outside the test's outer transaction."""
+        if db_engine.dialect.name == "sqlite":
+            pytest.skip("in-memory SQLite shares one connection across the session")
+        
+        project = Project(name="Isolated Project", owner_id=test_user.id)
+        db_session.add(project)
+        await db_session.commit()
+        
+        async with db_engine.connect() as other:
+            result = await other.execute(
+                select(func.count(Project.id)).where(Project.id == project.id)
+            )
+            assert result.scalar_one() == 0
@@ -0,0 +1,105 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.api.v1.endpoints.subscription import (
+    handle_subscription_created,
+    handle_subscription_deleted,
+    handle_subscription_updated,
+    upsert_subscription,
+)
+from app.models.subscription import Subscription, SubscriptionStatus
+from app.models.user import SubscriptionPlan
+
+
+def stripe_subscription(status: str) -> dict:
+    """Minimal Stripe subscription object as delivered in a webhook payload."""
+    return {
+        "id": "sub_test",
+        "customer": "cus_test",
+        "status": status,
+        "items": {"data": [{"price": {"id": "price_test", "product": "prod_test"}}]},
+        "current_period_start": 1_700_000_000,
+        "current_period_end": 1_702_592_000,
+        "cancel_at": None,
+        "canceled_at": None,
+        "trial_end": None,
+    }
+
+
+@pytest.mark.asyncio
+class TestUpsertSubscription:
+    """Test the INSERT ... ON CONFLICT DO UPDATE path used by the Stripe webhook."""
+    
+    @pytest.fixture(autouse=True)
+    def require_postgres(self, db_engine):
+        if db_engine.dialect.name != "postgresql":
+            pytest.skip("upsert uses the PostgreSQL ON CONFLICT dialect")
+    
+    async def stored_status(self, db_session, user_id) -> SubscriptionStatus:
+        result = await db_session.execute(
+            select(Subscription.status).where(Subscription.user_id == user_id)
+        )
+        return result.scalar_one()
+    
+    async def test_insert_then_newer_event_updates(self, db_session, test_user):
+        """A first event inserts the row and a newer event overwrites it."""
+        await upsert_subscription(db_session, test_user.id, stripe_subscription("active"), 100)
+        assert await self.stored_status(db_session, test_user.id) == SubscriptionStatus.ACTIVE
+        
+        await upsert_subscription(db_session, test_user.id, stripe_subscription("canceled"), 200)
+        assert await self.stored_status(db_session, test_user.id) == SubscriptionStatus.CANCELED
+    
+    async def test_stale_event_in_same_period_is_ignored(self, db_session, test_user):
+        """An older `active` event delivered after a `canceled` one must not revive it."""
+        await upsert_subscription(db_session, test_user.id, stripe_subscription("canceled"), 200)
+        await upsert_subscription(db_session, test_user.id, stripe_subscription("active"), 100)
+        
+        assert await self.stored_status(db_session, test_user.id) == SubscriptionStatus.CANCELED
+    
+    async def test_duplicate_event_is_ignored(self, db_session, test_user):
+        """A retried event with the same timestamp leaves the stored row alone."""
+        await upsert_subscription(db_session, test_user.id, stripe_subscription("past_due"), 100)
+        await upsert_subscription(db_session, test_user.id, stripe_subscription("active"), 100)
+        
+        assert await self.stored_status(db_session, test_user.id) == SubscriptionStatus.PAST_DUE
+
+
+@pytest.mark.asyncio
+class TestSubscriptionWebhookHandlers:
+    """Test that the user's plan follows the stored subscription status."""
+    
+    @pytest.fixture(autouse=True)
+    def require_postgres(self, db_engine):
+        if db_engine.dialect.name != "postgresql":
+            pytest.skip("upsert uses the PostgreSQL ON CONFLICT dialect")
+    
+    @pytest_asyncio.fixture(loop_scope="session")
+    async def customer(self, db_session, test_user):
+        test_user.stripe_customer_id = "cus_test"
+        await db_session.flush()
+        return test_user
+    
+    async def test_created_and_updated_sync_plan(self, db_session, customer):
+        """A paid status promotes the user; an unpaid one moves them back to free."""
+        await handle_subscription_created(db_session, stripe_subscription("active"), 100)
+        assert customer.subscription_plan == SubscriptionPlan.PRO
+        assert customer.stripe_subscription_id == "sub_test"
+        
+        await handle_subscription_updated(db_session, stripe_subscription("unpaid"), 200)
+        assert customer.subscription_plan == SubscriptionPlan.FREE
+        assert customer.stripe_subscription_id is None
+    
+    async def test_late_created_after_deleted_keeps_free_plan(self, db_session, customer):
+        """A created event redelivered after the deletion must not promote the user."""
+        await handle_subscription_created(db_session, stripe_subscription("active"), 100)
+        await handle_subscription_deleted(db_session, stripe_subscription("canceled"), 300)
+        assert customer.subscription_plan == SubscriptionPlan.FREE
+        
+        await handle_subscription_created(db_session, stripe_subscription("active"), 100)
+        
+        assert customer.subscription_plan == SubscriptionPlan.FREE
+        result = await db_session.execute(
+            select(Subscription.status).where(Subscription.user_id == customer.id)
+        )
+        assert result.scalar_one() == SubscriptionStatus.CANCELED
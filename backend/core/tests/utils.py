@@ -0,0 +1,21 @@
+from typing import Any
+
+import orjson
+from httpx import AsyncClient, Response
+
+
+class ORJSONAsyncClient(AsyncClient):
+    """AsyncClient that encodes ``json=`` request bodies with orjson."""
+
+    def build_request(self, method, url, *, json: Any = None, **kwargs):
+        if json is not None:
+            headers = dict(kwargs.get("headers") or {})
+            headers.setdefault("content-type", "application/json")
+            kwargs["headers"] = headers
+            kwargs["content"] = orjson.dumps(json)
+        return super().build_request(method, url, **kwargs)
+
+
+def response_json(response: Response) -> Any:
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(response.content)